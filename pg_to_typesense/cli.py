@@ -1,8 +1,10 @@
 import argparse
-from .config import load_config
-from .sync import setup, sync
+import logging
 
 def main():
+    # Progress output goes through logging so bulk setups can raise the
+    # level instead of paying for per-line stdout flushes.
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     parser = argparse.ArgumentParser(description="PostgreSQL to Typesense Sync Tool")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -14,31 +16,40 @@ def main():
     sync_parser = subparsers.add_parser("sync", help="Run the sync process.")
     sync_parser.add_argument("--batch-size", type=int, default=100, help="Number of items to process in a single batch.")
     sync_parser.add_argument("--tables", type=str, help="Comma-separated list of table names to sync (e.g., 'products,users'). If not specified, all tables are synced.")
+    sync_parser.add_argument("--worker-id", type=int, default=0, help="Zero-based id of this worker when running multiple sync workers in parallel.")
+    sync_parser.add_argument("--worker-count", type=int, default=1, help="Total number of parallel sync workers; each worker drains a disjoint hash partition of the queue.")
 
     status_parser = subparsers.add_parser("status", help="Display sync system status and statistics.")
     status_parser.add_argument("--tables", type=str, help="Comma-separated list of table names to check (e.g., 'products,users'). If not specified, all tables are shown.")
 
     args = parser.parse_args()
+
+    # Deferred imports: the sync module pulls in psycopg, typesense and tqdm,
+    # none of which are needed for --help or argparse errors.
+    from .config import load_config
     config = load_config()
     
     # Filter tables if specified
     if hasattr(args, 'tables') and args.tables:
-        requested_tables = [t.strip() for t in args.tables.split(',')]
-        original_count = len(config['tables'])
+        # Set membership keeps the filter O(tables) for large configs
+        requested_tables = {t.strip() for t in args.tables.split(',')}
+        available_tables = [t['name'] for t in config['tables']]
         config['tables'] = [t for t in config['tables'] if t['name'] in requested_tables]
-        
+
         if len(config['tables']) == 0:
-            print(f"✗ Error: No matching tables found for: {', '.join(requested_tables)}")
-            print(f"Available tables: {', '.join([t['name'] for t in load_config()['tables']])}")
+            print(f"✗ Error: No matching tables found for: {', '.join(sorted(requested_tables))}")
+            print(f"Available tables: {', '.join(available_tables)}")
             return
         
         filtered_names = [t['name'] for t in config['tables']]
-        print(f"Filtering to {len(config['tables'])} of {original_count} tables: {', '.join(filtered_names)}\n")
+        print(f"Filtering to {len(config['tables'])} of {len(available_tables)} tables: {', '.join(filtered_names)}\n")
 
     if args.command == "setup":
+        from .sync import setup
         setup(config, args.recreate, not args.backfill_queue)
     elif args.command == "sync":
-        sync(config, args.batch_size)
+        from .sync import sync
+        sync(config, args.batch_size, args.worker_id, args.worker_count)
     elif args.command == "status":
         from .sync import status
         status(config)
@@ -1,7 +1,56 @@
 import atexit
+import logging
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import psycopg
+from psycopg import sql
 from psycopg_pool import ConnectionPool
-from .utils import is_view
+
+log = logging.getLogger(__name__)
+
+
+# Single trigger function body, hoisted so setup can hash it and compare
+# against what is installed in pg_proc before issuing any DDL. It takes the
+# logical table name as a trigger argument (TG_ARGV[0]), which covers both
+# plain tables and views captured via a reference table — one function, one
+# CREATE OR REPLACE, one entry in the backend's function cache.
+_TRIGGER_FUNCTION_WITH_NAME_BODY = """
+    DECLARE
+        target_table_name TEXT;
+    BEGIN
+        -- Get the table name from trigger arguments
+        target_table_name := TG_ARGV[0];
+
+        IF (TG_OP = 'DELETE') THEN
+            INSERT INTO typesense_sync_queue (record_id, table_name, operation_type)
+            VALUES (OLD.id::TEXT, target_table_name, 'DELETE');
+            RETURN OLD;
+        ELSE
+            INSERT INTO typesense_sync_queue (record_id, table_name, operation_type)
+            VALUES (NEW.id::TEXT, target_table_name, TG_OP);
+            RETURN NEW;
+        END IF;
+    END;
+"""
+
+# prosrc is stored verbatim as the text between the dollar quotes, so setup
+# can compare md5(prosrc) on the server against the md5 of this exact
+# string and skip the CREATE OR REPLACE when nothing changed.
+_TRIGGER_FUNCTION_WITH_NAME_PROSRC = f"{_TRIGGER_FUNCTION_WITH_NAME_BODY}    "
+
+_EXPECTED_FUNCTION_MD5S = {
+    'log_changes_for_typesense_with_name':
+        hashlib.md5(_TRIGGER_FUNCTION_WITH_NAME_PROSRC.encode()).hexdigest(),
+}
+
+_TRIGGER_FUNCTION_WITH_NAME_SQL = f"""
+    CREATE OR REPLACE FUNCTION log_changes_for_typesense_with_name()
+    RETURNS TRIGGER AS $${_TRIGGER_FUNCTION_WITH_NAME_PROSRC}$$ LANGUAGE plpgsql
+"""
+
+# Rows per backfill chunk: each chunk is a separate COPY + commit so the
+# queue fill never runs as one table-sized transaction.
+_BACKFILL_CHUNK_ROWS = 50000
 
 
 class Database:
@@ -15,18 +64,22 @@ class Database:
             try:
                 self._connection_pool.close()
                 self._connection_pool = None
-                print("✓ Database connection pool closed")
+                log.info("✓ Database connection pool closed")
             except Exception as e:
-                print(f"⚠ Warning: Error closing connection pool: {e}")
+                log.warning("⚠ Warning: Error closing connection pool: %s", e)
 
-    def get_connection_pool(self):
-        """Get or create a connection pool for the database."""
+    @property
+    def _pool(self):
+        """The connection pool, created lazily on first access."""
         if self._connection_pool is None:
             try:
                 # Build connection string from config
+                # connect_timeout bounds hung DNS/TCP at connect time so a
+                # dead host fails in seconds instead of stalling setup.
                 conninfo = f"host={self.db_config['host']} port={self.db_config['port']} " \
                           f"dbname={self.db_config['dbname']} user={self.db_config['user']} " \
-                          f"password={self.db_config['password']}"
+                          f"password={self.db_config['password']} " \
+                          f"connect_timeout={self.db_config.get('connect_timeout', 5)}"
                 
                 # Create connection pool - connections created on demand
                 self._connection_pool = ConnectionPool(
@@ -38,277 +91,330 @@ class Database:
                     max_idle=300  # Maximum idle time before connection is closed (5 minutes)
                 )
             except Exception as e:
-                print(f"✗ Failed to create connection pool: {e}")
+                log.error("✗ Failed to create connection pool: %s", e)
                 raise
         
         return self._connection_pool
 
+    def get_connection_pool(self):
+        """Get or create a connection pool for the database."""
+        return self._pool
+
     def get_db_connection(self):
         """Get a connection from the pool.
-        
+
         Raises an exception if the connection pool cannot be created or a connection cannot be obtained.
         """
-        pool = self.get_connection_pool()
-        conn = pool.getconn()
-        return conn
+        return self._pool.getconn()
 
     def close_db_connection(self, conn):
         """Return a connection back to the pool."""
-        pool = self.get_connection_pool()
-        pool.putconn(conn)
+        self._pool.putconn(conn)
+
+    def connection(self):
+        """Context manager yielding a pooled connection.
+
+        Commits on clean exit and rolls back on exception, so callers don't
+        need manual putconn/rollback bookkeeping.
+        """
+        return self._pool.connection()
 
     def setup_database_objects(self, tables):
         """Validates database objects and creates only sync infrastructure with enhanced error handling."""
-        conn = self.get_db_connection()
-        try:
-            with conn.cursor() as cur:
+        # pool.connection() commits on clean exit and rolls back on error,
+        # so no manual commit/rollback/putconn bookkeeping is needed.
+        with self._pool.connection() as conn:
+            # Prepare every statement on first execution instead of after
+            # psycopg's default 5 runs: the catalog queries below are reused
+            # verbatim whenever setup runs again on this pooled connection,
+            # so parse/plan is paid once per connection rather than per call.
+            conn.prepare_threshold = 0
+            # Explicit transaction block: commits on clean exit, rolls back on
+            # any exception, and scopes the SET LOCALs below to this setup run.
+            with conn.transaction(), conn.cursor() as cur:
                 try:
-                    # First, validate that all source tables exist
-                    missing_tables = []
-                    missing_reference_tables = []
-                    
-                    for table in tables:
-                        table_name = table['name']
-                        cur.execute("""
-                            SELECT EXISTS (
-                                SELECT FROM information_schema.tables 
-                                WHERE table_schema = 'public' 
-                                AND table_name = %s
-                            );
-                        """, (table_name,))
-                        table_exists = cur.fetchone()[0]
-                        
-                        if not table_exists:
-                            missing_tables.append(table_name)
-                        else:
-                            # Check if it's a view
-                            if is_view(conn, table_name):
-                                print(f"✓ Source view '{table_name}' exists")
-                                # Validate reference_table is specified for views
-                                if 'reference_table' not in table:
-                                    raise Exception(f"View '{table_name}' requires 'reference_table' field in config")
-                            else:
-                                print(f"✓ Source table '{table_name}' exists")
-                        
-                        # Validate reference_table if specified
-                        if 'reference_table' in table:
-                            ref_table = table['reference_table']
-                            cur.execute("""
-                                SELECT EXISTS (
-                                    SELECT FROM information_schema.tables 
-                                    WHERE table_schema = 'public' 
-                                    AND table_name = %s
-                                );
-                            """, (ref_table,))
-                            ref_exists = cur.fetchone()[0]
-                            
-                            if not ref_exists:
-                                missing_reference_tables.append(f"{table_name} -> {ref_table}")
-                            else:
-                                print(f"✓ Reference table '{ref_table}' exists for '{table_name}'")
-                    
-                    if missing_tables:
-                        print(f"✗ Missing source tables: {', '.join(missing_tables)}")
-                        print("Please create these tables before running setup.")
-                        raise Exception(f"Source tables do not exist: {', '.join(missing_tables)}")
-                    
-                    if missing_reference_tables:
-                        print(f"✗ Missing reference tables: {', '.join(missing_reference_tables)}")
-                        raise Exception(f"Reference tables do not exist: {', '.join(missing_reference_tables)}")
-                    
-                    # Check if queue table exists and create if not
-                    cur.execute("""
-                        SELECT EXISTS (
-                            SELECT FROM information_schema.tables 
-                            WHERE table_schema = 'public' 
-                            AND table_name = 'typesense_sync_queue'
-                        );
-                    """)
-                    table_exists = cur.fetchone()[0]
-                    
-                    if not table_exists:
-                        print("Creating typesense_sync_queue table...")
-                        cur.execute("""
-                            CREATE TABLE typesense_sync_queue (
-                                id BIGSERIAL PRIMARY KEY, 
-                                record_id TEXT NOT NULL, 
-                                table_name TEXT NOT NULL, 
-                                operation_type VARCHAR(10) NOT NULL, 
-                                created_at TIMESTAMPTZ DEFAULT NOW()
-                            );
-                        """)
-                        print("✓ Queue table created")
-                    else:
-                        print("✓ Queue table already exists")
-                    
-                    # Check if trigger function exists and create/replace
+                    # Bound catalog-lock waits so DDL fails fast instead of
+                    # queueing behind long transactions, and skip the fsync on
+                    # the setup commit (the objects are rebuildable by rerun).
+                    cur.execute("SET LOCAL lock_timeout = '5s'")
+                    cur.execute("SET LOCAL statement_timeout = '60s'")
+                    cur.execute("SET LOCAL synchronous_commit = off")
+
+                    # Phase 1 — read-only catalog snapshot (3 queries total).
+                    # One batched pg_class query replaces the per-table (and
+                    # per reference-table) round-trips; the queue table check
+                    # rides along. pg_catalog is an indexed direct lookup, far
+                    # cheaper than the multi-join information_schema views.
+                    names = [t['name'] for t in tables]
+                    names += [t['reference_table'] for t in tables if 'reference_table' in t]
+                    names.append('typesense_sync_queue')
                     cur.execute("""
-                        SELECT EXISTS (
-                            SELECT FROM pg_proc 
-                            WHERE proname = 'log_changes_for_typesense'
-                        );
-                    """)
-                    function_exists = cur.fetchone()[0]
-                    
-                    print("Creating/updating trigger function...")
+                        SELECT c.relname, c.relkind FROM pg_class c
+                        JOIN pg_namespace n ON n.oid = c.relnamespace
+                        WHERE n.nspname = 'public'
+                        AND c.relname = ANY(%s::text[])
+                        AND c.relkind IN ('r', 'p', 'v', 'm');
+                    """, (names,))
+                    # relname -> relkind; view-ness comes for free with the
+                    # existence lookup, so no per-table is_view round trip.
+                    relkinds = dict(cur.fetchall())
+                    existing_tables = set(relkinds)
+
+                    # Installed function bodies, hashed server-side so the diff
+                    # below can skip the function DDL when nothing changed.
                     cur.execute("""
-                        CREATE OR REPLACE FUNCTION log_changes_for_typesense() 
-                        RETURNS TRIGGER AS $$ 
-                        BEGIN 
-                            IF (TG_OP = 'DELETE') THEN 
-                                INSERT INTO typesense_sync_queue (record_id, table_name, operation_type) 
-                                VALUES (OLD.id::TEXT, TG_TABLE_NAME, 'DELETE'); 
-                                RETURN OLD; 
-                            ELSE 
-                                INSERT INTO typesense_sync_queue (record_id, table_name, operation_type) 
-                                VALUES (NEW.id::TEXT, TG_TABLE_NAME, TG_OP); 
-                                RETURN NEW; 
-                            END IF; 
-                        END; 
-                        $$ LANGUAGE plpgsql;
+                        SELECT proname, md5(prosrc) FROM pg_proc
+                        WHERE proname = 'log_changes_for_typesense_with_name';
                     """)
-                    print("✓ Trigger function created/updated")
-                    
-                    # Create trigger function with custom table name for view support
+                    installed_functions = {row[0]: row[1] for row in cur.fetchall()}
+
+                    # Desired trigger set, derived purely in Python:
+                    # (trigger_name, target_table, trigger_function, table_name).
+                    # For views the trigger attaches to reference_table instead.
+                    expected_triggers = []
+                    for table in tables:
+                        # Destructure once: each key below would otherwise be
+                        # hashed and looked up several times per iteration.
+                        table_name, ref_table = table['name'], table.get('reference_table')
+                        if ref_table is not None:
+                            expected_triggers.append((
+                                f"trigger_{ref_table}_to_{table_name}_typesense",
+                                ref_table,
+                                f"log_changes_for_typesense_with_name('{table_name}')",
+                                table_name,
+                            ))
+                        else:
+                            expected_triggers.append((
+                                f"trigger_{table_name}_to_typesense",
+                                table_name,
+                                f"log_changes_for_typesense_with_name('{table_name}')",
+                                table_name,
+                            ))
+
+                    # Join pg_class for the relation name rather than casting
+                    # tgrelid through regclass per row.
                     cur.execute("""
-                        CREATE OR REPLACE FUNCTION log_changes_for_typesense_with_name() 
-                        RETURNS TRIGGER AS $$ 
-                        DECLARE
-                            target_table_name TEXT;
-                        BEGIN 
-                            -- Get the table name from trigger arguments
-                            target_table_name := TG_ARGV[0];
-                            
-                            IF (TG_OP = 'DELETE') THEN 
-                                INSERT INTO typesense_sync_queue (record_id, table_name, operation_type) 
-                                VALUES (OLD.id::TEXT, target_table_name, 'DELETE'); 
-                                RETURN OLD; 
-                            ELSE 
-                                INSERT INTO typesense_sync_queue (record_id, table_name, operation_type) 
-                                VALUES (NEW.id::TEXT, target_table_name, TG_OP); 
-                                RETURN NEW; 
-                            END IF; 
-                        END; 
-                        $$ LANGUAGE plpgsql;
-                    """)
-                    print("✓ View-aware trigger function created/updated")
-                    
-                    # Setup triggers for each table (we've already validated all tables exist)
+                        SELECT t.tgname, c.relname
+                        FROM pg_trigger t
+                        JOIN pg_class c ON c.oid = t.tgrelid
+                        WHERE t.tgname = ANY(%s);
+                    """, ([t[0] for t in expected_triggers],))
+                    existing_triggers = {(row[0], row[1]) for row in cur.fetchall()}
+
+                    # Phase 2 — pure-Python diff of desired vs. installed state.
+                    # Sources and reference tables were fetched in the same
+                    # batch, so one set difference covers the whole report
+                    # (names[:-1] excludes the queue-table probe).
+                    missing = [n for n in names[:-1] if n not in existing_tables]
+                    if missing:
+                        log.error("✗ Missing tables: %s", ', '.join(missing))
+                        log.info("Please create these tables before running setup.")
+                        raise Exception(f"Missing tables: {', '.join(missing)}")
+
                     for table in tables:
-                        table_name = table['name']
-                        
-                        # For views, attach trigger to reference_table instead
-                        if 'reference_table' in table:
-                            ref_table = table['reference_table']
-                            trigger_name = f"trigger_{ref_table}_to_{table_name}_typesense"
-                            target_table = ref_table
-                            print(f"Setting up trigger for view '{table_name}' via reference table '{ref_table}'...")
-                            trigger_function = f"log_changes_for_typesense_with_name('{table_name}')"
+                        table_name, ref_table = table['name'], table.get('reference_table')
+                        if relkinds.get(table_name) == 'v':
+                            log.info("✓ Source view '%s' exists", table_name)
+                            # Views must declare the table their trigger attaches to
+                            if ref_table is None:
+                                raise Exception(f"View '{table_name}' requires 'reference_table' field in config")
                         else:
-                            trigger_name = f"trigger_{table_name}_to_typesense"
-                            target_table = table_name
-                            trigger_function = "log_changes_for_typesense()"
-                        
-                        # Check if trigger already exists
-                        cur.execute("""
-                            SELECT EXISTS (
-                                SELECT FROM pg_trigger 
-                                WHERE tgname = %s 
-                                AND tgrelid = %s::regclass
-                            );
-                        """, (trigger_name, target_table))
-                        trigger_exists = cur.fetchone()[0]
-                        
-                        if not trigger_exists:
-                            print(f"Creating trigger on '{target_table}'...")
-                            cur.execute(f"""
-                                CREATE TRIGGER {trigger_name} 
-                                AFTER INSERT OR UPDATE OR DELETE ON {target_table} 
-                                FOR EACH ROW EXECUTE FUNCTION {trigger_function};
-                            """)
-                            print(f"✓ Trigger created on '{target_table}' for syncing '{table_name}'")
+                            log.info("✓ Source table '%s' exists", table_name)
+                        if ref_table is not None:
+                            log.info("✓ Reference table '%s' exists for '%s'", ref_table, table_name)
+
+                    need_queue_table = 'typesense_sync_queue' not in existing_tables
+                    functions_current = installed_functions == _EXPECTED_FUNCTION_MD5S
+                    missing_triggers = []
+                    for spec in expected_triggers:
+                        if (spec[0], spec[1]) in existing_triggers:
+                            log.info("✓ Trigger on '%s' already exists", spec[1])
                         else:
-                            print(f"✓ Trigger on '{target_table}' already exists")
+                            missing_triggers.append(spec)
+
+                    if not need_queue_table:
+                        log.info("✓ Queue table already exists")
+                    if functions_current:
+                        log.info("✓ Trigger function already up to date")
+
+                    # Phase 3 — pipelined DDL apply. Everything below is pure
+                    # emission with no fetches, so pipeline mode sends all
+                    # statements before reading any result: ~1 round-trip
+                    # regardless of how many objects are missing.
+                    with conn.pipeline():
+                        if need_queue_table:
+                            log.info("Creating typesense_sync_queue table...")
+                            cur.execute("""
+                                CREATE TABLE typesense_sync_queue (
+                                    id BIGSERIAL PRIMARY KEY,
+                                    record_id TEXT NOT NULL,
+                                    table_name TEXT NOT NULL,
+                                    operation_type VARCHAR(10) NOT NULL,
+                                    created_at TIMESTAMPTZ DEFAULT NOW()
+                                );
+                            """)
+                            log.info("✓ Queue table created")
+
+                        if not functions_current:
+                            log.info("Creating/updating trigger function...")
+                            cur.execute(_TRIGGER_FUNCTION_WITH_NAME_SQL)
+                            log.info("✓ Trigger function created/updated")
+
+                        for trigger_name, target_table, trigger_function, table_name in missing_triggers:
+                            if target_table != table_name:
+                                log.info("Setting up trigger for view '%s' via reference table '%s'...", table_name, target_table)
+                            log.info("Creating trigger on '%s'...", target_table)
+                            cur.execute(sql.SQL("""
+                                CREATE TRIGGER {}
+                                AFTER INSERT OR UPDATE OR DELETE ON {}
+                                FOR EACH ROW EXECUTE FUNCTION {};
+                            """).format(
+                                sql.Identifier(trigger_name),
+                                sql.Identifier(target_table),
+                                sql.SQL(trigger_function)))
+                            log.info("✓ Trigger created on '%s' for syncing '%s'", target_table, table_name)
                             
                 except psycopg.Error as e:
-                    print(f"Database error during setup: {e}")
-                    conn.rollback()
+                    log.error("Database error during setup: %s", e)
                     raise
                 except Exception as e:
-                    print(f"Unexpected error during database setup: {e}")
-                    conn.rollback()
+                    log.error("Unexpected error during database setup: %s", e)
                     raise
-                
-            conn.commit()
-            print("✓ Database setup completed successfully")
-        finally:
-            self.close_db_connection(conn)
+
+            log.info("✓ Database setup completed successfully")
+
+    def _backfill_table(self, table):
+        """Queues all existing records of a single table; returns the queued count."""
+        table_name = table['name']
+        collection_name = table['collection']
+        table_records_queued = 0
+
+        log.info("Starting backfill for table '%s' → collection '%s'...", table_name, collection_name)
+
+        with self._pool.connection() as conn:
+            with conn.cursor() as check_cur:
+                # Re-running backfill would double the queue: skip tables that
+                # already have queued entries. EXISTS stops at the first match,
+                # so this never rescans the queue.
+                check_cur.execute(
+                    "SELECT EXISTS (SELECT 1 FROM typesense_sync_queue WHERE table_name = %s)",
+                    (table_name,))
+                if check_cur.fetchone()[0]:
+                    log.info("  Queue already has entries for '%s'; skipping backfill "
+                             "(run sync or clear the queue first to re-queue)", table_name)
+                    return 0
+
+                # Empty-table guard: EXISTS stops at the first row, so empty
+                # tables skip the cursor/COPY machinery entirely.
+                check_cur.execute(sql.SQL("SELECT EXISTS (SELECT 1 FROM {} LIMIT 1)").format(
+                    sql.Identifier(table_name)))
+                if not check_cur.fetchone()[0]:
+                    log.info("  Table '%s' is empty; nothing to queue", table_name)
+                    return 0
+
+                # Cheap planner estimate for progress logging; a full
+                # COUNT(*) would sequential-scan large tables just for this
+                # message. The authoritative figure is the streamed row count.
+                # Qualified by namespace so a same-named table in another
+                # schema can't skew the estimate.
+                check_cur.execute("""
+                    SELECT reltuples::bigint FROM pg_class
+                    WHERE relname = %s
+                    AND relnamespace = (SELECT oid FROM pg_namespace WHERE nspname = 'public')
+                """, (table_name,))
+                row = check_cur.fetchone()
+                estimated_records = row[0] if row else 0
+                log.info("  ~%s records to queue (estimate)", f"{estimated_records:,}")
+
+            # Populate sync queue with all record IDs. Stream ids
+            # through a server-side cursor into a COPY, which has far
+            # lower per-row overhead than a single giant INSERT...SELECT
+            # and keeps client memory flat regardless of table size.
+            # Each chunk is committed separately (the cursor is declared
+            # WITH HOLD so it survives the commits): one huge transaction
+            # would pin WAL, block autovacuum on the queue table, and pay
+            # one giant fsync at the end instead of amortized smaller ones.
+            log.info("  Queuing all records from '%s' for sync...", table_name)
+            # Brief SHARE lock while the snapshot is taken: concurrent writers
+            # either commit before the cursor's snapshot (and are queued here)
+            # or block until the first chunk commit releases the lock, after
+            # which the already-installed trigger queues them. No window is
+            # left for a row to be silently omitted.
+            with conn.cursor() as lock_cur:
+                lock_cur.execute(sql.SQL("LOCK TABLE {} IN SHARE MODE").format(
+                    sql.Identifier(table_name)))
+            with conn.cursor(name='backfill_cur', withhold=True) as scur:
+                scur.itersize = _BACKFILL_CHUNK_ROWS
+                # No ORDER BY: processing order comes from the queue's own
+                # BIGSERIAL PK, and sorting the source table would cost an
+                # O(N log N) pass (on-disk for tables larger than work_mem).
+                scur.execute(sql.SQL("SELECT id::TEXT FROM {}").format(
+                    sql.Identifier(table_name)))
+                while True:
+                    rows = scur.fetchmany(_BACKFILL_CHUNK_ROWS)
+                    if not rows:
+                        break
+                    with conn.cursor() as insert_cur:
+                        with insert_cur.copy(
+                            "COPY typesense_sync_queue (record_id, table_name, operation_type) FROM STDIN"
+                        ) as cp:
+                            for row in rows:
+                                cp.write_row((row[0], table_name, 'INSERT'))
+                    conn.commit()
+                    table_records_queued += len(rows)
+
+            log.info("✓ Queued %s records from table '%s'", table_records_queued, table_name)
+
+        # pool.connection() committed the per-table transaction on exit
+        return table_records_queued
 
     def backfill_queue(self, tables):
-        """Populates the sync queue with all existing records for initial data load."""
+        """Populates the sync queue with all existing records for initial data load.
+
+        Tables are backfilled concurrently, each worker holding its own pooled
+        connection, so independent source tables overlap their scan/insert time.
+        """
         total_records_queued = 0
-        
+        pool = self.get_connection_pool()
+
+        # One batched existence check up front instead of one probe per
+        # worker; missing tables are reported and skipped here.
+        with pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT c.relname FROM pg_class c
+                    JOIN pg_namespace n ON n.oid = c.relnamespace
+                    WHERE n.nspname = 'public'
+                    AND c.relname = ANY(%s)
+                    AND c.relkind IN ('r', 'p', 'v', 'm');
+                """, ([t['name'] for t in tables],))
+                existing_tables = {row[0] for row in cur.fetchall()}
+
+        to_backfill = []
         for table in tables:
             table_name = table['name']
-            collection_name = table['collection']
-            table_records_queued = 0
-            
-            print(f"Starting backfill for table '{table_name}' → collection '{collection_name}'...")
-            
-            try:
-                conn = self.get_db_connection()
+            if table_name in existing_tables:
+                to_backfill.append(table)
+            else:
+                log.warning("⚠ Warning: Table '%s' does not exist. Skipping backfill.", table_name)
+
+        if not to_backfill:
+            log.info("\n✓ Backfill process completed: 0 total records queued")
+            return
+
+        # Cap at 8 workers: beyond that the single queue table's WAL writes
+        # become the bottleneck, and one pool slot is kept free for callers.
+        max_workers = min(8, len(to_backfill), max(1, pool.max_size - 1))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._backfill_table, table): table['name'] for table in to_backfill}
+            for future in as_completed(futures):
+                table_name = futures[future]
                 try:
-                    # Check if source table exists and has data
-                    with conn.cursor() as check_cur:
-                        check_cur.execute("""
-                            SELECT EXISTS (
-                                SELECT FROM information_schema.tables 
-                                WHERE table_schema = 'public' 
-                                AND table_name = %s
-                            );
-                        """, (table_name,))
-                        table_exists = check_cur.fetchone()[0]
-                        
-                        if not table_exists:
-                            print(f"⚠ Warning: Table '{table_name}' does not exist. Skipping backfill.")
-                            continue
-                        
-                        # Get record count for progress tracking
-                        check_cur.execute(f"SELECT COUNT(*) FROM {table_name}")
-                        total_records = check_cur.fetchone()[0]
-                        print(f"  Total records to queue: {total_records}")
-                        
-                        if total_records == 0:
-                            print(f"  Table '{table_name}' is empty. Skipping backfill.")
-                            continue
-                    
-                    # Populate sync queue with all record IDs
-                    with conn.cursor() as insert_cur:
-                        print(f"  Queuing all records from '{table_name}' for sync...")
-                        
-                        # Insert all record IDs into the sync queue as INSERT operations
-                        insert_cur.execute(f"""
-                            INSERT INTO typesense_sync_queue (record_id, table_name, operation_type)
-                            SELECT id::TEXT, %s, 'INSERT'
-                            FROM {table_name}
-                            ORDER BY id
-                        """, (table_name,))
-                        
-                        table_records_queued = insert_cur.rowcount
-                        total_records_queued += table_records_queued
-                        
-                        print(f"✓ Queued {table_records_queued} records from table '{table_name}'")
-                    
-                    # Commit after each table
-                    conn.commit()
-                    
-                finally:
-                    self.close_db_connection(conn)
-                
-            except Exception as e:
-                print(f"✗ Failed to queue records from table '{table_name}': {e}")
-                # No rollback needed since we commit per table
-                continue
-        
-        print(f"\n✓ Backfill process completed: {total_records_queued} total records queued")
-        print("  Run 'sync' command to process the queue and load data into Typesense")
+                    total_records_queued += future.result()
+                except Exception as e:
+                    log.error("✗ Failed to queue records from table '%s': %s", table_name, e)
+                    # Each worker commits per table, so no rollback is needed
+
+        log.info("\n✓ Backfill process completed: %s total records queued", total_records_queued)
+        log.info("  Run 'sync' command to process the queue and load data into Typesense")
@@ -1,10 +1,183 @@
+import hashlib
+import json
+import logging
 import sys
-from collections import defaultdict
+import uuid
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import groupby
+from operator import itemgetter
+from psycopg import sql
 from psycopg.rows import dict_row
 from tqdm import tqdm
 from .db import Database
 from .typesense_client import get_typesense_client, setup_typesense_collections
-from .utils import normalize_document_for_typesense, apply_column_aliases, remove_unmapped_fields
+from .utils import build_document_compiled, compile_schema
+
+# Optional accelerators for the unchanged-document skip cache: orjson
+# serializes the doc faster than stdlib json and xxhash hashes the bytes
+# faster than md5. Both degrade gracefully to the stdlib.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Hot-loop output goes through logging: lazy %-formatting means muted levels
+# cost nothing, unlike eagerly evaluated print(f"...") calls.
+log = logging.getLogger(__name__)
+
+# Typesense calls are pure network wait (the client releases the GIL during
+# HTTP I/O), so per-collection upserts and deletes run concurrently.
+_TYPESENSE_MAX_WORKERS = 8
+
+# Max documents per import_ call: one giant payload can push Typesense past
+# its healthy-write-lag threshold and start returning 503s, so large batches
+# are streamed as sub-batches instead.
+TYPESENSE_IMPORT_CHUNK = 10_000
+
+
+def _upsert_collection(ts_client, collection, docs):
+    """Imports one collection's documents; returns (success, upserted count)."""
+    success = True
+    upserted = 0
+    documents = ts_client.collections[collection].documents
+    for i in range(0, len(docs), TYPESENSE_IMPORT_CHUNK):
+        chunk = docs[i:i + TYPESENSE_IMPORT_CHUNK]
+        try:
+            # batch_size also paces ingestion server-side within the chunk.
+            # import_ encodes list payloads doc by doc with stdlib json —
+            # the dominant client-side cost on large chunks — but passes
+            # pre-serialized payloads through untouched, so with orjson
+            # available the JSONL is built here and the raw JSONL response
+            # decoded back.
+            if orjson is not None:
+                payload = b"\n".join(orjson.dumps(doc) for doc in chunk)
+                result = documents.import_(payload, {'action': 'upsert', 'batch_size': 1000})
+                if isinstance(result, (bytes, str)):
+                    result = [orjson.loads(line) for line in result.splitlines() if line]
+            else:
+                result = documents.import_(chunk, {'action': 'upsert', 'batch_size': 1000})
+            upserted += len(chunk)
+            for doc in result:
+                if doc['success'] is False:
+                    log.error("Error upserting document: %s", doc['error'])
+                    success = False
+        except Exception as e:
+            log.error("✗ Failed to upsert to collection '%s': %s", collection, e)
+            success = False
+    return success, upserted
+
+
+# Ids per delete-by-filter call, sized to stay under URL/server limits.
+_TYPESENSE_DELETE_CHUNK = 500
+
+# Python-side casts for the queue's text record_ids, keyed by the source
+# table's pk type: converting once per batch lets the records map use the
+# native id as its key instead of str()-ing every fetched row.
+_ID_PYTHON_CASTS = {
+    'uuid': uuid.UUID,
+    'smallint': int,
+    'integer': int,
+    'bigint': int,
+}
+
+# Grouping key for the batch categorize pass.
+_job_group_key = itemgetter('table_name', 'operation_type')
+
+
+def _specialize_transformer(transformer, table_name, record):
+    """Returns a column-set-specialized version of a configured transformer.
+
+    When the transformer's module exposes a compile_transformer hook (see
+    transformers.py), it is asked once per table with the first fetched
+    row's column set; the hook keeps the configured function whenever
+    specialization does not apply. Modules without the hook, and any
+    compile failure, fall back to the configured transformer unchanged.
+    """
+    if transformer is None:
+        return None
+    module = sys.modules.get(getattr(transformer, '__module__', None))
+    compiler = getattr(module, 'compile_transformer', None)
+    if compiler is None:
+        return transformer
+    try:
+        specialized = compiler(table_name, frozenset(record), transformer)
+    except Exception as e:
+        log.warning("⚠ Warning: Could not specialize transformer for table '%s': %s", table_name, e)
+        return transformer
+    return specialized if specialized is not None else transformer
+
+# Upper bound on the unchanged-document skip cache. Each entry is a
+# (collection, id) key plus a small hash, so a full cache stays in the
+# low hundreds of MB while covering update storms over ~1M documents.
+_DOC_HASH_CACHE_MAX = 1_000_000
+
+
+def _doc_hash(doc):
+    """Stable content hash of a built document.
+
+    Key order is normalized so two builds of the same row hash alike
+    regardless of dict insertion order.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(doc, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(doc, sort_keys=True, default=str).encode()
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(payload)
+    return hashlib.md5(payload).digest()
+
+
+def _delete_collection(ts_client, collection, ids):
+    """Deletes one collection's documents by id; returns (success, deleted count).
+
+    Takes raw document ids (any iterable of strings) rather than
+    {'id': ...} wrappers. Uses delete-by-filter (`id:[...]`) so a chunk of
+    ids costs one round-trip instead of one per document; only a failing
+    chunk falls back to per-document deletes.
+    """
+    success = True
+    deleted = 0
+    ids = list(ids)
+    documents = ts_client.collections[collection].documents
+    for i in range(0, len(ids), _TYPESENSE_DELETE_CHUNK):
+        chunk = ids[i:i + _TYPESENSE_DELETE_CHUNK]
+        id_filter = "id:[{}]".format(','.join(chunk))
+        try:
+            documents.delete({'filter_by': id_filter})
+            # Ids already absent simply match nothing; the outcome is the
+            # same as the 404-tolerant per-document path.
+            deleted += len(chunk)
+            continue
+        except Exception as e:
+            log.warning("⚠ Warning: Bulk delete failed in collection '%s': %s. "
+                        "Retrying chunk individually...", collection, e)
+
+        failed = 0
+        for doc_id in chunk:
+            try:
+                result = documents[doc_id].delete()
+                # Validate the result has the expected id field
+                if result and 'id' in result:
+                    deleted += 1
+                else:
+                    log.warning("⚠ Warning: Unexpected delete response for document %s: %s", doc_id, result)
+                    failed += 1
+            except Exception as del_err:
+                # Document may already be deleted (404), treat as success
+                if "404" in str(del_err) or "Not Found" in str(del_err):
+                    deleted += 1
+                else:
+                    log.warning("⚠ Warning: Failed to delete document %s: %s", doc_id, del_err)
+                    failed += 1
+                    success = False
+        if failed > 0:
+            log.warning("⚠ %d delete(s) failed in collection '%s'", failed, collection)
+    return success, deleted
 
 def setup(config, recreate_collections=False, skip_backfill=True):
     """Main function to handle the setup command with enhanced initialization logic.
@@ -14,7 +187,7 @@ def setup(config, recreate_collections=False, skip_backfill=True):
         recreate_collections: Whether to recreate existing Typesense collections
         skip_backfill: Whether to skip initial data backfill (default: True)
     """
-    print("Starting setup...")
+    log.info("Starting setup...")
     
     # Initialize database connection with error handling
     db = Database(config['postgresql'])
@@ -22,271 +195,426 @@ def setup(config, recreate_collections=False, skip_backfill=True):
     # Initialize Typesense client with error handling
     try:
         ts_client = get_typesense_client(config['typesense'])
-        print("✓ Typesense client initialized")
+        log.info("✓ Typesense client initialized")
     except Exception as e:
-        print(f"✗ Failed to initialize Typesense client: {e}")
+        log.error("✗ Failed to initialize Typesense client: %s", e)
         return False
     
     # Setup database objects with validation
     try:
         db.setup_database_objects(config['tables'])
-        print("✓ Database objects setup completed")
+        log.info("✓ Database objects setup completed")
     except Exception as e:
-        print(f"✗ Failed to setup database objects: {e}")
+        log.error("✗ Failed to setup database objects: %s", e)
         return False
     
     # Setup Typesense collections with validation
     try:
         setup_typesense_collections(ts_client, config['tables'], recreate_collections)
-        print("✓ Typesense collections setup completed")
+        log.info("✓ Typesense collections setup completed")
     except Exception as e:
-        print(f"✗ Failed to setup Typesense collections: {e}")
+        log.error("✗ Failed to setup Typesense collections: %s", e)
         return False
     
     # Perform backfill if requested
     if not skip_backfill:
-        print("Starting initial data backfill...")
+        log.info("Starting initial data backfill...")
         try:
             db.backfill_queue(config['tables'])
-            print("✓ Data backfill completed")
+            log.info("✓ Data backfill completed")
         except Exception as e:
-            print(f"✗ Failed during data backfill: {e}")
+            log.error("✗ Failed during data backfill: %s", e)
             return False
     else:
-        print("ℹ Queue backfill skipped (use --backfill-queue to enable)")
+        log.info("ℹ Queue backfill skipped (use --backfill-queue to enable)")
     
-    print("\n✓ Setup completed successfully")
+    log.info("\n✓ Setup completed successfully")
     return True
 
 
-def sync(config, batch_size=100):
-    """Processes all changes from the queue in batches with enhanced error handling."""
-    print(f"Starting sync process (batch size: {batch_size})...")
-    
+def sync(config, batch_size=100, worker_id=0, worker_count=1):
+    """Processes all changes from the queue in batches with enhanced error handling.
+
+    With worker_count > 1, this process only drains the hash partition of
+    the queue assigned to worker_id, so N workers run in parallel over
+    disjoint record sets without lock contention.
+    """
+    if worker_count < 1 or not 0 <= worker_id < worker_count:
+        log.error("✗ Invalid worker assignment: --worker-id must be in [0, worker-count), got id=%d count=%d", worker_id, worker_count)
+        return False
+
+    if worker_count > 1:
+        log.info("Starting sync process (batch size: %d, worker %d of %d)...", batch_size, worker_id, worker_count)
+    else:
+        log.info("Starting sync process (batch size: %d)...", batch_size)
+
     # Initialize connections with error handling
     db = Database(config['postgresql'])
     try:
-        db_conn = db.get_db_connection()
+        ts_client = get_typesense_client(config['typesense'])
     except Exception as e:
-        print(f"✗ Failed to connect to database for sync: {e}")
+        log.error("✗ Failed to connect to Typesense for sync: %s", e)
         return False
-    
+
+    table_map = {t['name']: t for t in config['tables']}
+
     try:
-        ts_client = get_typesense_client(config['typesense'])
+        # Pooled connection context: commits on clean exit, rolls back and
+        # returns the connection on error.
+        with db.connection() as db_conn:
+            return _sync_queue(db_conn, ts_client, table_map, batch_size,
+                               worker_id, worker_count)
     except Exception as e:
-        print(f"✗ Failed to connect to Typesense for sync: {e}")
-        db.close_db_connection(db_conn)
+        log.error("✗ Failed to connect to database for sync: %s", e)
         return False
-    
-    table_map = {t['name']: t for t in config['tables']}
-    
-    # Check if sync queue table exists
+
+
+def _sync_queue(db_conn, ts_client, table_map, batch_size, worker_id=0, worker_count=1):
+    """Drains the sync queue over an open database connection."""
+    # Check if sync queue table exists. to_regclass is a single syscache
+    # lookup — no information_schema joins — and the COUNT(*) that used to
+    # follow is gone entirely: on a queue with millions of rows it cost a
+    # full scan just to seed a progress bar, and the batch loop already
+    # stops on its own when no jobs remain.
     try:
-        with db_conn.cursor(row_factory=dict_row) as check_cur:
-            check_cur.execute("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables 
-                    WHERE table_schema = 'public' 
-                    AND table_name = 'typesense_sync_queue'
-                ) as queue_exists;
-            """)
-            result = check_cur.fetchone()
-            queue_exists = result['queue_exists']
-            if not queue_exists:
-                print("✗ Sync queue table does not exist. Please run setup first.")
-                db.close_db_connection(db_conn)
+        with db_conn.cursor() as check_cur:
+            check_cur.execute("SELECT to_regclass('public.typesense_sync_queue') IS NOT NULL;")
+            if not check_cur.fetchone()[0]:
+                log.error("✗ Sync queue table does not exist. Please run setup first.")
                 return False
-            
-            # Get total count of jobs to process (filtered by selected tables)
-            table_names = list(table_map.keys())
-            table_name_placeholders = ', '.join(['%s'] * len(table_names))
-            check_cur.execute(f"SELECT COUNT(*) as total FROM typesense_sync_queue WHERE table_name IN ({table_name_placeholders})", table_names)
-            total_jobs = check_cur.fetchone()['total']
-            
-            if total_jobs == 0:
-                print("✓ No new jobs to process for selected tables.")
-                db.close_db_connection(db_conn)
-                return True
-            
-            print(f"Total jobs in queue for selected tables: {total_jobs}")
     except Exception as e:
-        print(f"✗ Failed to check sync queue: {e}")
-        db.close_db_connection(db_conn)
+        log.error("✗ Failed to check sync queue: %s", e)
         return False
-    
+
+    # Resolve each source table's id column type once so the record fetch can
+    # bind its parameter as the real array type (ANY(%s::uuid[]) etc.) and
+    # the server skips per-row text coercion. Unknown tables fall back to a
+    # plain text cast, which matches the queue's record_id storage.
+    try:
+        with db_conn.cursor() as pk_cur:
+            pk_cur.execute("""
+                SELECT c.relname, format_type(a.atttypid, NULL)
+                FROM pg_attribute a
+                JOIN pg_class c ON c.oid = a.attrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = 'public'
+                AND a.attname = 'id'
+                AND c.relname = ANY(%s::text[]);
+            """, (list(table_map.keys()),))
+            pk_types = dict(pk_cur.fetchall())
+    except Exception as e:
+        log.warning("⚠ Warning: Could not resolve primary key types: %s", e)
+        db_conn.rollback()
+        pk_types = {}
+
+    # Unknown pk type (probe failed or table absent): leave the array
+    # uncast so the server infers its type from the id column — forcing
+    # ::text[] would break uuid/bigint ids with 'uuid = text' errors.
+    fetch_queries = {
+        name: (sql.SQL("SELECT * FROM {} WHERE id = ANY(%s::{}[])").format(
+                   sql.Identifier(name), sql.SQL(pk_types[name]))
+               if name in pk_types else
+               sql.SQL("SELECT * FROM {} WHERE id = ANY(%s)").format(
+                   sql.Identifier(name)))
+        for name in table_map
+    }
+    id_casters = {name: _ID_PYTHON_CASTS.get(pk_types.get(name)) for name in table_map}
+
+    # Per-table config unpacked once into tuples: the hot loops below would
+    # otherwise re-hash dict keys per record. The schema/column-mapping pair
+    # is compiled to frozen field metadata here since neither changes during
+    # a run; the local helper binding skips the module-attribute lookup.
+    table_cfg = {
+        name: (cfg['transformer'], cfg['collection'],
+               compile_schema(cfg['schema'], cfg.get('column_mapping', {})))
+        for name, cfg in table_map.items()
+    }
+    build_doc = build_document_compiled
+
+    # begin_batch hooks, resolved once per transformer module (same hook
+    # pattern as _specialize_transformer): modules that expose one — see
+    # transformers.begin_batch — capture the batch timestamp a single time
+    # per batch instead of calling time.time() per row.
+    batch_hooks = []
+    for module_name in {getattr(transformer, '__module__', None)
+                        for transformer, _collection, _fields in table_cfg.values()
+                        if transformer is not None}:
+        hook = getattr(sys.modules.get(module_name), 'begin_batch', None)
+        if hook is not None:
+            batch_hooks.append(hook)
+
+    # Horizontal partitioning: with N workers, each claims a disjoint slice
+    # of the queue by hashing (table_name, record_id) — so every job for a
+    # given record lands on the same worker and per-record ordering holds —
+    # and additionally takes a transaction-scoped advisory lock per picked
+    # row, which fences workers without the predicate-lock conflicts that
+    # row locks alone cause under serializable isolation. Single-worker
+    # runs skip both predicates entirely.
+    if worker_count > 1:
+        partition_clause = """
+                            AND mod(abs(hashtext(table_name || '/' || record_id)), %s) = %s
+                            AND pg_try_advisory_xact_lock(hashtext('tsq'), hashtext(id::text))"""
+        partition_params = [worker_count, worker_id]
+    else:
+        partition_clause = ""
+        partition_params = []
+
+    # The pick statement is hoisted out of the batch loop and its table
+    # filter is a single array parameter (= ANY) instead of a rebuilt
+    # IN (...) placeholder list: constant SQL text means the server's plan
+    # cache hits on every iteration rather than re-planning per batch.
+    #
+    # The SKIP LOCKED pick and the cleanup delete are fused into one
+    # statement: rows are removed atomically at commit (a crash mid-batch
+    # rolls them back into the queue), halving the round-trips and index
+    # traversals per batch. DISTINCT ON then dedups at the source, keeping
+    # only the newest op per (record_id, table_name); the window count
+    # (evaluated before DISTINCT ON filters rows) reports the total picked,
+    # dominated rows included, for progress tracking.
+    queue_sql = f"""
+        WITH picked AS (
+            SELECT id FROM typesense_sync_queue
+            WHERE table_name = ANY(%s::text[]){partition_clause}
+            ORDER BY created_at ASC
+            LIMIT %s
+            FOR UPDATE SKIP LOCKED
+        ), deleted AS (
+            DELETE FROM typesense_sync_queue q
+            USING picked p
+            WHERE q.id = p.id
+            RETURNING q.*
+        )
+        SELECT DISTINCT ON (record_id, table_name) *,
+               count(*) OVER () AS picked_jobs
+        FROM deleted
+        ORDER BY record_id, table_name, created_at DESC;
+    """
+    queue_params = [list(table_map.keys())] + partition_params + [batch_size]
+
     # Process all jobs with tqdm progress bar
     total_processed = 0
     total_upserts = 0
     total_deletes = 0
-    
-    with tqdm(total=total_jobs, desc="Syncing", unit="jobs") as pbar:
+    total_unchanged = 0
+    had_error = False
+
+    # Skip cache for no-op upserts: triggers fire on every row touch, so
+    # update storms often re-queue rows whose content is unchanged. Hashing
+    # the built doc and comparing against the last synced hash drops those
+    # before they cost an HTTP round-trip. Bounded LRU; a miss (evicted or
+    # first sight) just means one redundant upsert, never a lost write.
+    doc_hashes = OrderedDict()
+
+    # Transformers specialized once per table from the first fetched row's
+    # column set (see _specialize_transformer); tables whose transformer
+    # module offers no hook keep the configured function.
+    specialized_transformers = {}
+
+    # One thread pool for the whole drain: collections are independent, so
+    # their Typesense round-trips overlap instead of serializing. The
+    # progress bar is open-ended since the total is no longer counted.
+    with ThreadPoolExecutor(max_workers=_TYPESENSE_MAX_WORKERS) as ts_pool, \
+            tqdm(desc="Syncing", unit="jobs") as pbar:
         while True:
             try:
-                # Start a transaction manually
-                with db_conn.cursor(row_factory=dict_row) as cur:
-                    # Fetch jobs from queue
-                    table_name_placeholders = ', '.join(['%s'] * len(table_map.keys()))
-
-                    # Build the full SQL query
-                    sql_query = f"""
-                        SELECT * FROM typesense_sync_queue
-                        WHERE table_name IN ({table_name_placeholders})
-                        ORDER BY created_at ASC
-                        LIMIT %s
-                        FOR UPDATE SKIP LOCKED;
-                    """
-
-                    # Create a list of parameters in the correct order
-                    params = list(table_map.keys()) + [batch_size]
-
-                    cur.execute(sql_query, params)
+                # Start a transaction manually. binary=True receives rows in
+                # PG's binary format — cheaper to decode than text for the
+                # uuid/timestamptz/bigint columns these cursors return.
+                with db_conn.cursor(row_factory=dict_row, binary=True) as cur:
+                    # Data-modifying CTEs cannot run in a DECLAREd cursor, so
+                    # this uses the regular cursor.
+                    cur.execute(queue_sql, queue_params)
                     jobs = cur.fetchall()
 
                     if not jobs:
                         break
-                    
-                    # Deduplicate jobs (keep latest operation for each record)
-                    final_ops = { (job['record_id'], job['table_name']): job for job in jobs }
+                    picked_jobs = jobs[0]['picked_jobs']
 
-                    ids_to_fetch = defaultdict(list)
-                    deletes = defaultdict(list)
+                    for begin_batch in batch_hooks:
+                        begin_batch()
 
-                    # Categorize operations
-                    for (record_id, table_name), job in final_ops.items():
-                        if table_name not in table_map:
-                            tqdm.write(f"⚠ Warning: Unknown table '{table_name}' in sync queue. Skipping.")
+                    # Categorize operations: one sort + groupby turns the
+                    # per-row defaultdict hashing and list appends into one
+                    # comprehension per (table, op) group.
+                    jobs.sort(key=_job_group_key)
+                    ids_to_fetch = {}
+                    # Raw id strings, not {'id': ...} wrappers: the bulk
+                    # filter_by delete only needs the ids, and a set dedups
+                    # queue-delete/missing-record overlap for free.
+                    deletes = defaultdict(set)
+                    for (table_name, operation_type), group in groupby(jobs, key=_job_group_key):
+                        cfg = table_cfg.get(table_name)
+                        if cfg is None:
+                            log.warning("⚠ Warning: Unknown table '%s' in sync queue. Skipping.", table_name)
                             continue
-                            
-                        collection = table_map[table_name]['collection']
-                        if job['operation_type'] in ['INSERT', 'UPDATE']:
-                            ids_to_fetch[table_name].append(record_id)
-                        elif job['operation_type'] == 'DELETE':
-                            deletes[collection].append({'id': record_id})
+
+                        if operation_type in ('INSERT', 'UPDATE'):
+                            ids_to_fetch.setdefault(table_name, []).extend(
+                                job['record_id'] for job in group)
+                        elif operation_type == 'DELETE':
+                            collection = cfg[1]
+                            for job in group:
+                                deletes[collection].add(job['record_id'])
+                                # Forget the hash so a re-created row with
+                                # identical content is not skipped.
+                                doc_hashes.pop((collection, job['record_id']), None)
+
+                    # Fetch all tables' records in one network round-trip:
+                    # pipeline mode sends the per-table selects back-to-back
+                    # and reads all replies afterwards, so K tables no longer
+                    # cost K sequential round-trips. (A UNION ALL would do the
+                    # same in one statement, but the source tables have
+                    # heterogeneous columns, so their SELECT * branches can't
+                    # be unioned.)
+                    fetched = []
+                    try:
+                        with db_conn.pipeline():
+                            for table_name, ids in ids_to_fetch.items():
+                                # Cast the queue's text ids to the pk's native
+                                # Python type once per table, so the records
+                                # map below can key rows without a per-row
+                                # str() round-trip.
+                                caster = id_casters[table_name]
+                                if caster is not None:
+                                    ids = [caster(record_id) for record_id in ids]
+                                # Text mode, unlike the queue cursor: these
+                                # SELECT * fetches can include pgvector
+                                # columns, and without registered pgvector
+                                # adapters psycopg's binary fallback for
+                                # unknown OIDs yields raw bytes instead of
+                                # the '[1.0, 2.0]' text that
+                                # convert_vector_to_float_array parses.
+                                fetch_cur = db_conn.cursor(row_factory=dict_row)
+                                # Queries were composed once per table at sync
+                                # start with the pk array-type cast baked in.
+                                fetch_cur.execute(fetch_queries[table_name], (ids,))
+                                fetched.append((table_name, ids, fetch_cur))
+                    except Exception as e:
+                        log.warning("⚠ Warning: Failed to fetch records for upserts: %s", e)
+                        fetched = []
 
                     # Process upserts
                     upserts = defaultdict(list)
-                    for table_name, ids in ids_to_fetch.items():
-                        if table_name not in table_map:
-                            continue
-                            
-                        transformer = table_map[table_name]['transformer']
-                        collection = table_map[table_name]['collection']
-                        schema = table_map[table_name]['schema']
-                        column_mapping = table_map[table_name].get('column_mapping', {})
+                    for table_name, ids, fetch_cur in fetched:
+                        transformer, collection, compiled_fields = table_cfg[table_name]
 
                         try:
-                            cur.execute(f"SELECT * FROM {table_name} WHERE id = ANY(%s)", (ids,))
-                            records = {str(row['id']): dict(row) for row in cur.fetchall()}
+                            # dict_row already yields plain dicts owned by this
+                            # loop, so no defensive dict(row) copy is needed —
+                            # that doubled allocation traffic on wide tables.
+                            # Keys stay in the id's native type when the
+                            # lookup ids were cast to match at fetch time.
+                            with fetch_cur:
+                                if id_casters[table_name] is not None:
+                                    records = {row['id']: row for row in fetch_cur}
+                                else:
+                                    # No known cast for this pk type
+                                    # (numeric, a domain, ...): psycopg may
+                                    # decode row['id'] to a native type while
+                                    # the queue's record_ids stay text, so
+                                    # normalize the keys through str to match
+                                    # the lookup ids.
+                                    records = {str(row['id']): row for row in fetch_cur}
+
+                            if records and table_name not in specialized_transformers:
+                                first_row = next(iter(records.values()))
+                                specialized_transformers[table_name] = _specialize_transformer(
+                                    transformer, table_name, first_row)
+                            transformer = specialized_transformers.get(table_name, transformer)
 
                             for record_id in ids:
                                 if record_id in records:
                                     try:
-                                        doc = transformer(records[record_id])
-                                        # Apply column aliasing (PostgreSQL names -> Typesense names)
-                                        doc = apply_column_aliases(doc, column_mapping)
-                                        # Remove fields not in schema
-                                        doc = remove_unmapped_fields(doc, schema)
-                                        # Normalize document values (handles date conversion automatically)
-                                        doc = normalize_document_for_typesense(doc, schema)
+                                        doc = records[record_id]
+                                        # None means identity: skip the call frame
+                                        if transformer is not None:
+                                            doc = transformer(doc)
+                                        # Alias, filter and normalize in one pass
+                                        doc = build_doc(doc, compiled_fields)
                                         # print(f"✓ Transformed record {doc}")
+                                        doc_key = (collection, doc.get('id'))
+                                        content_hash = _doc_hash(doc)
+                                        if doc_hashes.get(doc_key) == content_hash:
+                                            # Same payload as last sync: a no-op
+                                            # upsert, not worth sending.
+                                            doc_hashes.move_to_end(doc_key)
+                                            total_unchanged += 1
+                                            continue
+                                        doc_hashes[doc_key] = content_hash
+                                        doc_hashes.move_to_end(doc_key)
+                                        if len(doc_hashes) > _DOC_HASH_CACHE_MAX:
+                                            doc_hashes.popitem(last=False)
                                         upserts[collection].append(doc)
                                     except Exception as e:
-                                        tqdm.write(f"⚠ Warning: Failed to transform record {record_id}: {e}")
+                                        log.warning("⚠ Warning: Failed to transform record %s: %s", record_id, e)
                                 else:
                                     # Record no longer exists, treat as delete
-                                    deletes[collection].append({'id': record_id})
+                                    # (Typesense document ids are strings)
+                                    deletes[collection].add(str(record_id))
+                                    doc_hashes.pop((collection, str(record_id)), None)
                                     
                         except Exception as e:
-                            tqdm.write(f"⚠ Warning: Failed to fetch records from table '{table_name}': {e}")
+                            log.warning("⚠ Warning: Failed to fetch records from table '%s': %s", table_name, e)
 
-                    # Sync to Typesense
+                    # Sync to Typesense: submit every collection's upserts and
+                    # deletes at once, then aggregate as the futures finish.
                     sync_success = True
                     try:
                         upsert_count = 0
                         delete_count = 0
-                        
-                        for collection, docs in upserts.items():
-                            if docs:
-                                try:
-                                    result = ts_client.collections[collection].documents.import_(docs, {'action': 'upsert'})
-                                    upsert_count += len(docs)
-                                    for doc in result:
-                                        if doc['success'] is False:
-                                            tqdm.write(f"Error upserting document: {doc['error']}")
-                                            sync_success = False
-                                except Exception as e:
-                                    tqdm.write(f"✗ Failed to upsert to collection '{collection}': {e}")
-                                    sync_success = False
-                                    
-                        for collection, docs in deletes.items():
-                            if docs:
-                                try:
-                                    # Delete documents individually (Typesense doesn't support batch delete via import_)
-                                    deleted = 0
-                                    failed = 0
-                                    for doc in docs:
-                                        try:
-                                            result = ts_client.collections[collection].documents[doc['id']].delete()
-                                            # Validate the result has the expected id field
-                                            if result and 'id' in result:
-                                                deleted += 1
-                                            else:
-                                                tqdm.write(f"⚠ Warning: Unexpected delete response for document {doc['id']}: {result}")
-                                                failed += 1
-                                        except Exception as del_err:
-                                            # Document may already be deleted (404), treat as success
-                                            if "404" in str(del_err) or "Not Found" in str(del_err):
-                                                deleted += 1
-                                            else:
-                                                tqdm.write(f"⚠ Warning: Failed to delete document {doc['id']}: {del_err}")
-                                                failed += 1
-                                                sync_success = False
-                                    delete_count += deleted
-                                    if failed > 0:
-                                        tqdm.write(f"⚠ {failed} delete(s) failed in collection '{collection}'")
-                                except Exception as e:
-                                    tqdm.write(f"✗ Failed to delete from collection '{collection}': {e}")
-                                    sync_success = False
-                        
+
+                        upsert_futures = [
+                            ts_pool.submit(_upsert_collection, ts_client, collection, docs)
+                            for collection, docs in upserts.items() if docs
+                        ]
+                        delete_futures = [
+                            ts_pool.submit(_delete_collection, ts_client, collection, ids)
+                            for collection, ids in deletes.items() if ids
+                        ]
+
+                        for future in as_completed(upsert_futures):
+                            success, count = future.result()
+                            sync_success = sync_success and success
+                            upsert_count += count
+
+                        for future in as_completed(delete_futures):
+                            success, count = future.result()
+                            sync_success = sync_success and success
+                            delete_count += count
+
                         if not sync_success:
                             raise Exception("One or more Typesense operations failed")
-                        
+
                         total_upserts += upsert_count
                         total_deletes += delete_count
-                        
-                    except Exception as e:
-                        tqdm.write(f"✗ Error syncing to Typesense: {e}")
-                        db_conn.rollback()
-                        raise  # Re-raise to exit the loop
 
-                    # Clean up processed jobs
-                    try:
-                        job_ids = [job['id'] for job in jobs]
-                        cur.execute("DELETE FROM typesense_sync_queue WHERE id = ANY(%s)", (job_ids,))
-                        deleted_count = cur.rowcount
-                        total_processed += deleted_count
-                        pbar.update(deleted_count)
                     except Exception as e:
-                        tqdm.write(f"⚠ Warning: Failed to clean up processed jobs: {e}")
+                        log.error("✗ Error syncing to Typesense: %s", e)
                         db_conn.rollback()
                         raise  # Re-raise to exit the loop
-                    
-                    # Commit the transaction
+
+                    # The batch's queue rows were already deleted by the CTE;
+                    # committing makes the removal visible. A failure before
+                    # this point rolled back, leaving them queued for retry.
+                    total_processed += picked_jobs
+                    pbar.update(picked_jobs)
                     db_conn.commit()
                     
             except Exception as e:
-                tqdm.write(f"✗ Error processing batch: {e}")
-                tqdm.write("  Transaction rolled back. Jobs remain in queue for retry.")
+                log.error("✗ Error processing batch: %s", e)
+                log.error("  Transaction rolled back. Jobs remain in queue for retry.")
+                had_error = True
                 break
-    
-    db.close_db_connection(db_conn)
-    
+
+    if had_error:
+        log.warning("\n⚠ Sync stopped after %d jobs; remaining jobs stay queued for retry", total_processed)
+        return False
     if total_processed > 0:
-        print(f"\n✓ Sync completed: {total_processed} jobs processed ({total_upserts} upserts, {total_deletes} deletes)")
-        return True
+        log.info("\n✓ Sync completed: %d jobs processed (%d upserts, %d deletes, %d unchanged skipped)",
+                 total_processed, total_upserts, total_deletes, total_unchanged)
     else:
-        print(f"\n⚠ Sync completed with no jobs processed")
-        return False
+        log.info("\n✓ No new jobs to process for selected tables.")
+    return True
 
 
 def status(config):
@@ -299,14 +627,23 @@ def status(config):
     print("\n[Database Connection]")
     db = Database(config['postgresql'])
     try:
-        db_conn = db.get_db_connection()
-        print(f"✓ PostgreSQL: Connected")
-        print(f"  Host: {config['postgresql']['host']}:{config['postgresql']['port']}")
-        print(f"  Database: {config['postgresql']['dbname']}")
+        with db.connection() as db_conn:
+            print(f"✓ PostgreSQL: Connected")
+            # Server version comes from the connection startup packet via
+            # conn.info — no round trip, unlike SELECT version().
+            server_version = db_conn.info.server_version
+            print(f"  Host: {config['postgresql']['host']}:{config['postgresql']['port']}")
+            print(f"  Database: {config['postgresql']['dbname']}")
+            print(f"  Server: PostgreSQL {server_version // 10000}.{server_version % 100}")
+            return _status_with_connection(db_conn, config)
     except Exception as e:
         print(f"✗ PostgreSQL: Connection failed")
         print(f"  Error: {e}")
         return False
+
+
+def _status_with_connection(db_conn, config):
+    """Reports Typesense, queue and per-table status over an open connection."""
     
     # Test Typesense connection
     print("\n[Typesense Connection]")
@@ -326,7 +663,6 @@ def status(config):
     except Exception as e:
         print(f"✗ Typesense: Connection failed")
         print(f"  Error: {e}")
-        db_conn.close()
         return False
     
     # Check if sync queue exists
@@ -394,52 +730,49 @@ def status(config):
     # Check configured tables and collections
     print(f"\n[Configured Tables]")
     print(f"Total configured: {len(config['tables'])}")
-    
+
+    # One catalog round-trip covers every table: existence, a free
+    # reltuples row estimate (COUNT(*) would scan each table), and the
+    # trigger probe correlated against the same pg_class row. This used
+    # to be three queries per configured table.
+    table_stats = {}
+    try:
+        with db_conn.cursor() as cur:
+            cur.execute("""
+                SELECT c.relname,
+                       c.reltuples::bigint AS approx_count,
+                       EXISTS (
+                           SELECT 1 FROM pg_trigger t
+                           WHERE t.tgname = 'trigger_' || c.relname || '_to_typesense'
+                           AND t.tgrelid = c.oid
+                       ) AS has_trigger
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = 'public'
+                AND c.relkind IN ('r', 'p', 'v', 'm')
+                AND c.relname = ANY(%s::text[]);
+            """, ([t['name'] for t in config['tables']],))
+            table_stats = {row[0]: (row[1], row[2]) for row in cur.fetchall()}
+    except Exception as e:
+        print(f"    ✗ Error checking source tables: {e}")
+
     for table in config['tables']:
         table_name = table['name']
         collection_name = table['collection']
         print(f"\n  Table: {table_name} → Collection: {collection_name}")
-        
-        # Check if source table exists
-        try:
-            with db_conn.cursor() as cur:
-                cur.execute("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables 
-                        WHERE table_schema = 'public' 
-                        AND table_name = %s
-                    );
-                """, (table_name,))
-                table_exists = cur.fetchone()[0]
-                
-                if table_exists:
-                    print(f"    ✓ Source table exists")
-                    
-                    # Get record count
-                    cur.execute(f"SELECT COUNT(*) FROM {table_name}")
-                    count = cur.fetchone()[0]
-                    print(f"      Records: {count}")
-                    
-                    # Check if trigger exists
-                    trigger_name = f"trigger_{table_name}_to_typesense"
-                    cur.execute("""
-                        SELECT EXISTS (
-                            SELECT FROM pg_trigger 
-                            WHERE tgname = %s 
-                            AND tgrelid = %s::regclass
-                        );
-                    """, (trigger_name, table_name))
-                    trigger_exists = cur.fetchone()[0]
-                    
-                    if trigger_exists:
-                        print(f"      ✓ Trigger installed")
-                    else:
-                        print(f"      ✗ Trigger not found")
-                else:
-                    print(f"    ✗ Source table does not exist")
-        except Exception as e:
-            print(f"    ✗ Error checking source table: {e}")
-        
+
+        stats = table_stats.get(table_name)
+        if stats is not None:
+            approx_count, has_trigger = stats
+            print(f"    ✓ Source table exists")
+            print(f"      Records: ~{approx_count:,} (estimate)")
+            if has_trigger:
+                print(f"      ✓ Trigger installed")
+            else:
+                print(f"      ✗ Trigger not found")
+        else:
+            print(f"    ✗ Source table does not exist")
+
         # Check if Typesense collection exists
         if collection_name in existing_collections:
             collection_info = existing_collections[collection_name]
@@ -450,7 +783,6 @@ def status(config):
             print(f"    ✗ Typesense collection does not exist")
             print(f"      Run 'setup' command to create collections")
     
-    db.close_db_connection(db_conn)
     print("\n" + "=" * 70)
     print("Status check completed")
     print("=" * 70)
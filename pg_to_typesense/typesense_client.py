@@ -1,4 +1,59 @@
+import types
+
 import typesense
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _install_orjson_encoder():
+    """Swaps the client's JSON encoder for orjson when it is available.
+
+    Replaces the json module reference inside typesense.api_call with an
+    orjson-backed shim (3-10x faster), covering the request bodies that go
+    through api_call: searches, collection and document operations.
+    Document import batches do not pass through this seam — import_ has
+    its own encoder — so the sync loop pre-serializes those payloads
+    itself (see _upsert_collection in sync.py). If orjson is not
+    installed, or the client internals have moved, the stdlib encoder is
+    left alone.
+    """
+    if orjson is None:
+        return
+    api_call_module = getattr(typesense, 'api_call', None)
+    if api_call_module is None or not hasattr(api_call_module, 'json'):
+        return
+    api_call_module.json = types.SimpleNamespace(
+        dumps=lambda obj, **kwargs: orjson.dumps(obj).decode(),
+        loads=orjson.loads,
+    )
+
+
+_install_orjson_encoder()
+
+
+def _install_pooled_session(client):
+    """Backs the client's HTTP calls with a keep-alive connection pool.
+
+    typesense-python issues its requests through client.api_call; recent
+    versions keep a `session` attribute there. When present, swap in a
+    requests.Session whose adapter pool is sized for the concurrent sync
+    workers, so calls reuse TCP/TLS connections instead of re-handshaking.
+    Older client versions without the attribute are left untouched.
+    """
+    api_call = getattr(client, 'api_call', None)
+    if api_call is None or not hasattr(api_call, 'session'):
+        return
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=2)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    api_call.session = session
+
 
 def get_typesense_client(ts_config):
     """Creates and validates a Typesense client connection."""
@@ -9,9 +64,10 @@ def get_typesense_client(ts_config):
             'connection_timeout_seconds': 10
         }
         print(f"Creating Typesense client with config: {ts_config['protocol']}://{ts_config['host']}:{ts_config['port']}")
-        
+
         client = typesense.Client(config)
-        
+        _install_pooled_session(client)
+
         # Test connection by attempting to retrieve collections
         try:
             collections_response = client.collections.retrieve()
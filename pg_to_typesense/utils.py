@@ -1,278 +1,597 @@
-"""
-Utility functions for data transformation and type conversion
-"""
-import time
-from datetime import datetime, date
-from typing import Any, Optional, List, Union
-
-
-def convert_date_to_timestamp(value: Any) -> Optional[int]:
-    """
-    Convert various date/datetime formats to Unix timestamp (int64).
-    
-    Supports:
-    - datetime.datetime objects
-    - datetime.date objects
-    - ISO format strings (YYYY-MM-DD, YYYY-MM-DDTHH:MM:SS, etc.)
-    - Unix timestamps (int/float) - passed through
-    - None - returns None
-    
-    Args:
-        value: The value to convert
-    
-    Returns:
-        Unix timestamp as integer, or None if value is None
-    
-    Raises:
-        ValueError: If the value cannot be converted to a timestamp
-    """
-    if value is None:
-        return None
-    
-    # Already a timestamp (int or float)
-    if isinstance(value, (int, float)):
-        return int(value)
-    
-    # datetime.datetime object
-    if isinstance(value, datetime):
-        return int(value.timestamp())
-    
-    # datetime.date object (without time)
-    if isinstance(value, date):
-        # Convert to datetime at midnight UTC
-        dt = datetime.combine(value, datetime.min.time())
-        return int(dt.timestamp())
-    
-    # String - try to parse as ISO format
-    if isinstance(value, str):
-        # Remove timezone indicator 'Z' and replace with '+00:00' for parsing
-        value_normalized = value.replace('Z', '+00:00')
-        
-        # Try various datetime formats
-        formats = [
-            '%Y-%m-%d %H:%M:%S',           # 2024-01-15 14:30:00
-            '%Y-%m-%d %H:%M:%S.%f',        # 2024-01-15 14:30:00.123456
-            '%Y-%m-%dT%H:%M:%S',           # 2024-01-15T14:30:00
-            '%Y-%m-%dT%H:%M:%S.%f',        # 2024-01-15T14:30:00.123456
-            '%Y-%m-%d',                     # 2024-01-15
-        ]
-        
-        # First, try ISO format with fromisoformat (handles timezones)
-        try:
-            dt = datetime.fromisoformat(value_normalized)
-            return int(dt.timestamp())
-        except (ValueError, AttributeError):
-            pass
-        
-        # Try each format
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(value, fmt)
-                return int(dt.timestamp())
-            except ValueError:
-                continue
-        
-        # If all formats fail, raise error
-        raise ValueError(
-            f"Unable to parse date string: {value}. "
-            f"Expected formats: ISO 8601 or standard date/datetime formats"
-        )
-    
-    raise ValueError(f"Unsupported date type: {type(value).__name__}. Value: {value}")
-
-
-def normalize_document_for_typesense(doc: dict, schema: list) -> dict:
-    """
-    Normalize a document according to the schema, converting types as needed.
-    
-    Args:
-        doc: The document to normalize
-        schema: The schema definition with field types and properties
-    
-    Returns:
-        Normalized document with converted values
-    """
-    normalized = doc.copy()
-    
-    # Create a lookup of field types
-    field_types = {field['name']: field for field in schema}
-    
-    for field_name, field_config in field_types.items():
-        if field_name not in normalized:
-            continue
-        
-        value = normalized[field_name]
-        
-        # Handle date type conversion
-        if field_config.get('source_type') == 'date':
-            try:
-                normalized[field_name] = convert_date_to_timestamp(value)
-            except ValueError as e:
-                print(f"⚠ Warning: Failed to convert date field '{field_name}': {e}")
-                # Set to None if conversion fails
-                normalized[field_name] = None
-        
-        # Handle vector type conversion
-        elif field_config.get('source_type') == 'vector':
-            try:
-                normalized[field_name] = convert_vector_to_float_array(value)
-            except ValueError as e:
-                print(f"⚠ Warning: Failed to convert vector field '{field_name}': {e}")
-                # Set to None if conversion fails
-                normalized[field_name] = None
-        
-        # Ensure non-string, non-numeric, non-bool, non-list values are converted to strings
-        elif not isinstance(value, (str, int, float, bool, list, type(None))):
-            # Handle special types
-            if isinstance(value, (datetime, date)):
-                # Convert to timestamp if not already marked as date type
-                normalized[field_name] = convert_date_to_timestamp(value)
-            else:
-                normalized[field_name] = str(value)
-    
-    return normalized
-
-
-def get_current_timestamp() -> int:
-    """Get current Unix timestamp as int64"""
-    return int(time.time())
-
-
-def convert_vector_to_float_array(value: Any) -> Optional[List[float]]:
-    """
-    Convert PostgreSQL vector (pgvector) to float array for Typesense.
-    
-    Supports:
-    - pgvector.Vector objects
-    - String representations: "[1.0, 2.0, 3.0]"
-    - Lists/tuples of numbers
-    - None values
-    
-    Args:
-        value: The vector value to convert
-    
-    Returns:
-        List of floats, or None if value is None
-    
-    Raises:
-        ValueError: If the value cannot be converted to a float array
-    """
-    if value is None:
-        return None
-    
-    # Already a list
-    if isinstance(value, list):
-        try:
-            return [float(x) for x in value]
-        except (TypeError, ValueError) as e:
-            raise ValueError(f"Invalid vector list: {value}. Error: {e}")
-    
-    # Tuple
-    if isinstance(value, tuple):
-        try:
-            return [float(x) for x in value]
-        except (TypeError, ValueError) as e:
-            raise ValueError(f"Invalid vector tuple: {value}. Error: {e}")
-    
-    
-    # pgvector Vector object
-    if hasattr(value, 'tolist'):
-        # pgvector.Vector has a tolist() method
-        try:
-            result = value.tolist()
-            return [float(x) for x in result]
-        except Exception as e:
-            raise ValueError(f"Failed to convert pgvector.Vector: {e}")
-    
-    # String representation
-    if isinstance(value, str):
-        # Try parsing as string representation of list
-        # pgvector returns strings like "[1.0, 2.0, 3.0]"
-        value = value.strip()
-        
-        if value.startswith('[') and value.endswith(']'):
-            try:
-                # Remove brackets and split by comma
-                inner = value[1:-1].strip()
-                if not inner:
-                    return []
-                
-                parts = inner.split(',')
-                return [float(x.strip()) for x in parts]
-            except (ValueError, AttributeError) as e:
-                raise ValueError(f"Failed to parse vector string: {value}. Error: {e}")
-        else:
-            raise ValueError(f"Vector string must be in format '[x, y, z]': {value}")
-    
-    # Try converting directly if it has __iter__ (but not dict, set, etc.)
-    if hasattr(value, '__iter__') and not isinstance(value, (str, bytes, dict, set)):
-        try:
-            return [float(x) for x in value]
-        except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to convert iterable to vector: {value}. Error: {e}")
-    
-    raise ValueError(f"Unsupported vector type: {type(value).__name__}. Value: {value}")
-
-
-def apply_column_aliases(doc: dict, column_mapping: dict) -> dict:
-    """
-    Apply column aliasing to map PostgreSQL column names to Typesense field names.
-    
-    Args:
-        doc: Document with PostgreSQL column names
-        column_mapping: Dict mapping Typesense field names to PostgreSQL column names
-    
-    Returns:
-        Document with Typesense field names
-    """
-    if not column_mapping:
-        return doc
-    
-    aliased_doc = {}
-    
-    # Reverse the mapping: PostgreSQL -> Typesense
-    reverse_mapping = {pg_name: ts_name for ts_name, pg_name in column_mapping.items()}
-    
-    for pg_col, value in doc.items():
-        # Use the aliased name if it exists, otherwise keep original
-        ts_col = reverse_mapping.get(pg_col, pg_col)
-        aliased_doc[ts_col] = value
-    
-    return aliased_doc
-
-
-def remove_unmapped_fields(doc: dict, schema: list) -> dict:
-    """
-    Remove fields from document that are not in the schema.
-    
-    Args:
-        doc: Document to filter
-        schema: Schema definition with field names
-    
-    Returns:
-        Filtered document with only schema fields
-    """
-    schema_fields = {field['name'] for field in schema}
-    return {k: v for k, v in doc.items() if k in schema_fields}
-
-
-def is_view(conn, table_name: str) -> bool:
-    """
-    Check if a table name is actually a view.
-    
-    Args:
-        conn: PostgreSQL database connection
-        table_name: Name of the table/view to check
-    
-    Returns:
-        True if the table is a view, False if it's a base table
-    """
-    with conn.cursor() as cur:
-        cur.execute("""
-            SELECT table_type FROM information_schema.tables
-            WHERE table_schema = 'public' AND table_name = %s
-        """, (table_name,))
-        result = cur.fetchone()
-        if result:
-            return result[0] == 'VIEW'
-        return False
+"""
+Utility functions for data transformation and type conversion
+"""
+import logging
+import sys
+import time
+from datetime import datetime, date
+from functools import lru_cache
+from typing import Any, Optional, List, Union
+
+log = logging.getLogger(__name__)
+
+# Conversion warnings are sampled per (kind, field): a pathological batch
+# fails on every row, and emitting each one serializes the hot loop on the
+# logging/stdio lock. The first failure and every Nth after it are logged
+# with a running count, bounding worst-case overhead without going silent.
+_WARN_SAMPLE_EVERY = 100
+_warn_counts: dict = {}
+
+
+def _warn_conversion(kind: str, field_name: str, error: Exception) -> None:
+    key = (kind, field_name)
+    count = _warn_counts.get(key, 0) + 1
+    _warn_counts[key] = count
+    if count == 1 or count % _WARN_SAMPLE_EVERY == 0:
+        log.warning("⚠ Warning: Failed to convert %s field '%s' (%d so far): %s",
+                    kind, field_name, count, error)
+
+
+# Optional accelerator for vector conversion: numpy casts a whole
+# embedding to float in C, vs per-element float() boxing in Python.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# From 3.11 fromisoformat accepts everything the old strptime format list
+# covered (space or T separator, fractional seconds, 'Z' suffix), so the
+# ~60x-slower strptime cascade only exists as a pre-3.11 fallback.
+_FROMISOFORMAT_IS_LENIENT = sys.version_info >= (3, 11)
+
+
+@lru_cache(maxsize=4096)
+def _parse_str_to_ts(value: str) -> int:
+    """
+    Parse a date/datetime string to a Unix timestamp.
+
+    Cached because bulk syncs repeat the same created_at/updated_at strings
+    heavily; the cache bound keeps memory fixed while turning repeat parses
+    into a dict lookup.
+
+    Raises:
+        ValueError: If the string cannot be parsed
+    """
+    if _FROMISOFORMAT_IS_LENIENT:
+        try:
+            return int(datetime.fromisoformat(value).timestamp())
+        except ValueError:
+            raise ValueError(
+                f"Unable to parse date string: {value}. "
+                f"Expected formats: ISO 8601 or standard date/datetime formats"
+            )
+
+    # Pre-3.11: fromisoformat is strict, so normalize 'Z' and fall back to
+    # the strptime formats it cannot handle.
+    try:
+        return int(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp())
+    except (ValueError, AttributeError):
+        pass
+
+    formats = [
+        '%Y-%m-%d %H:%M:%S',           # 2024-01-15 14:30:00
+        '%Y-%m-%d %H:%M:%S.%f',        # 2024-01-15 14:30:00.123456
+        '%Y-%m-%dT%H:%M:%S',           # 2024-01-15T14:30:00
+        '%Y-%m-%dT%H:%M:%S.%f',        # 2024-01-15T14:30:00.123456
+        '%Y-%m-%d',                     # 2024-01-15
+    ]
+    for fmt in formats:
+        try:
+            return int(datetime.strptime(value, fmt).timestamp())
+        except ValueError:
+            continue
+
+    raise ValueError(
+        f"Unable to parse date string: {value}. "
+        f"Expected formats: ISO 8601 or standard date/datetime formats"
+    )
+
+
+# Types Typesense accepts as-is: one O(1) exact-type membership check
+# replaces a linear isinstance scan over six types per field. Subclasses
+# miss here and fall through to the isinstance path.
+_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, list, type(None)})
+
+# Midnight constant for bare-date conversion, built once instead of per call
+_MIDNIGHT = datetime.min.time()
+
+# Exact-type dispatch for convert_date_to_timestamp: one dict lookup
+# replaces the linear isinstance cascade for the overwhelmingly common
+# concrete types. Subclasses miss here and take the slow path below.
+_DATE_DISPATCH = {
+    type(None): lambda v: None,
+    int: int,
+    float: int,
+    datetime: lambda v: int(v.timestamp()),
+    # Midnight on a bare date
+    date: lambda v: int(datetime.combine(v, _MIDNIGHT).timestamp()),
+    str: _parse_str_to_ts,
+}
+
+
+def convert_date_to_timestamp(value: Any) -> Optional[int]:
+    """
+    Convert various date/datetime formats to Unix timestamp (int64).
+
+    Supports:
+    - datetime.datetime objects
+    - datetime.date objects
+    - ISO format strings (YYYY-MM-DD, YYYY-MM-DDTHH:MM:SS, etc.)
+    - Unix timestamps (int/float) - passed through
+    - None - returns None
+
+    Args:
+        value: The value to convert
+
+    Returns:
+        Unix timestamp as integer, or None if value is None
+
+    Raises:
+        ValueError: If the value cannot be converted to a timestamp
+    """
+    fn = _DATE_DISPATCH.get(type(value))
+    if fn is not None:
+        return fn(value)
+    return _convert_date_to_timestamp_slow(value)
+
+
+def _convert_date_to_timestamp_slow(value: Any) -> Optional[int]:
+    """isinstance fallback for subclasses of the dispatched types."""
+    if value is None:
+        return None
+
+    # Already a timestamp (int or float)
+    if isinstance(value, (int, float)):
+        return int(value)
+
+    # datetime.datetime object
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+
+    # datetime.date object (without time)
+    if isinstance(value, date):
+        # Convert to datetime at midnight UTC
+        dt = datetime.combine(value, _MIDNIGHT)
+        return int(dt.timestamp())
+
+    # String - cached parse (repeat strings cost a dict lookup)
+    if isinstance(value, str):
+        return _parse_str_to_ts(value)
+
+    raise ValueError(f"Unsupported date type: {type(value).__name__}. Value: {value}")
+
+
+# Memoized per-schema lookups for the standalone normalize/filter helpers.
+# Keyed by id() with an identity check against the stored schema, so a
+# recycled id can never serve a stale entry; config schemas live for the
+# whole process, making the identity hit rate effectively 100%.
+_SCHEMA_INDEX_CACHE: dict = {}
+
+
+def _schema_index(schema: list) -> tuple:
+    """
+    Return (schema, field_types_dict, field_name_set, buckets) for a
+    schema list, computed once per schema object instead of once per
+    document. buckets partitions the field names by source_type into
+    (date_fields, vector_fields, generic_fields) tuples, so the
+    per-document normalize pass runs three straight-line loops instead of
+    re-deciding each field's branch per document.
+    """
+    key = id(schema)
+    cached = _SCHEMA_INDEX_CACHE.get(key)
+    if cached is None or cached[0] is not schema:
+        if len(_SCHEMA_INDEX_CACHE) > 64:
+            _SCHEMA_INDEX_CACHE.clear()
+        field_types = {field['name']: field for field in schema}
+        date_fields = []
+        vector_fields = []
+        generic_fields = []
+        for field in schema:
+            source_type = field.get('source_type')
+            if source_type == 'date':
+                date_fields.append(field['name'])
+            elif source_type == 'vector':
+                vector_fields.append(field['name'])
+            else:
+                generic_fields.append(field['name'])
+        buckets = (tuple(date_fields), tuple(vector_fields), tuple(generic_fields))
+        cached = (schema, field_types, frozenset(field_types), buckets)
+        _SCHEMA_INDEX_CACHE[key] = cached
+    return cached
+
+
+def normalize_document_for_typesense(doc: dict, schema: list, *, inplace: bool = False) -> dict:
+    """
+    Normalize a document according to the schema, converting types as needed.
+
+    Args:
+        doc: The document to normalize
+        schema: The schema definition with field types and properties
+        inplace: Mutate doc directly instead of copying it first. Saves a
+            dict allocation per document in hot loops; the caller must not
+            retain the pre-normalized view.
+
+    Returns:
+        Normalized document with converted values
+    """
+    # Fields pre-partitioned by source_type, memoized per schema: three
+    # tight loops, each with its branch decision already made.
+    date_fields, vector_fields, generic_fields = _schema_index(schema)[3]
+
+    # Scalar-only schema: with no date or vector fields the pass can only
+    # stringify exotic values, and those are rare — probe for them first
+    # and return the document untouched (no copy at all) when none exist.
+    if not date_fields and not vector_fields:
+        if all(type(doc[name]) in _PASSTHROUGH_TYPES
+               for name in generic_fields if name in doc):
+            return doc
+
+    normalized = doc if inplace else doc.copy()
+
+    # Date conversion. Already-int timestamps (Postgres epoch columns)
+    # skip the call entirely.
+    for field_name in date_fields:
+        if field_name in normalized:
+            value = normalized[field_name]
+            if type(value) is int:
+                continue
+            try:
+                normalized[field_name] = convert_date_to_timestamp(value)
+            except ValueError as e:
+                _warn_conversion('date', field_name, e)
+                # Set to None if conversion fails
+                normalized[field_name] = None
+
+    # Vector conversion; float lists are already converted
+    for field_name in vector_fields:
+        if field_name in normalized:
+            value = normalized[field_name]
+            if type(value) is list and value and type(value[0]) is float:
+                continue
+            try:
+                normalized[field_name] = convert_vector_to_float_array(value)
+            except ValueError as e:
+                _warn_conversion('vector', field_name, e)
+                # Set to None if conversion fails
+                normalized[field_name] = None
+
+    # Ensure non-string, non-numeric, non-bool, non-list values are converted to strings
+    for field_name in generic_fields:
+        if field_name in normalized:
+            value = normalized[field_name]
+            # Exact-type fast path; virtually every value stops here
+            if type(value) in _PASSTHROUGH_TYPES:
+                continue
+            if not isinstance(value, (str, int, float, bool, list, type(None))):
+                # Handle special types
+                if isinstance(value, (datetime, date)):
+                    # Convert to timestamp if not already marked as date type
+                    normalized[field_name] = convert_date_to_timestamp(value)
+                else:
+                    normalized[field_name] = str(value)
+
+    return normalized
+
+
+def compile_schema(schema: list, column_mapping: dict) -> tuple:
+    """
+    Precompute the per-field metadata build_document needs.
+
+    The schema and column mapping never change during a sync run, so the
+    column_mapping.get and field.get lookups are resolved once per table
+    here instead of once per field per document.
+
+    Args:
+        schema: The schema definition with field types and properties
+        column_mapping: Dict mapping Typesense field names to PostgreSQL column names
+
+    Returns:
+        Tuple of (field_name, source_key, source_type) triples
+    """
+    return tuple(
+        (field['name'], column_mapping.get(field['name'], field['name']),
+         field.get('source_type'))
+        for field in schema
+    )
+
+
+def build_document(record: dict, schema: list, column_mapping: dict) -> dict:
+    """
+    Build a Typesense document from a PostgreSQL record in a single pass.
+
+    Fuses apply_column_aliases, remove_unmapped_fields and
+    normalize_document_for_typesense: one walk over the schema aliases each
+    field from its source column and normalizes its value, so each record
+    costs one dict allocation and one iteration instead of three.
+
+    Args:
+        record: Row from PostgreSQL (column names as keys)
+        schema: The schema definition with field types and properties
+        column_mapping: Dict mapping Typesense field names to PostgreSQL column names
+
+    Returns:
+        Document with Typesense field names and normalized values
+    """
+    return build_document_compiled(record, compile_schema(schema, column_mapping))
+
+
+def build_document_compiled(record: dict, compiled_fields: tuple) -> dict:
+    """
+    build_document over pre-compiled field metadata (see compile_schema).
+
+    Callers processing many records per table should compile once and use
+    this directly; build_document wraps it for one-off use.
+    """
+    doc = {}
+
+    for field_name, source_key, source_type in compiled_fields:
+        if source_key not in record:
+            continue
+
+        value = record[source_key]
+
+        # Handle date type conversion. Already-int timestamps (Postgres
+        # epoch columns) skip the call entirely.
+        if source_type == 'date':
+            if type(value) is not int:
+                try:
+                    value = convert_date_to_timestamp(value)
+                except ValueError as e:
+                    _warn_conversion('date', field_name, e)
+                    # Set to None if conversion fails
+                    value = None
+
+        # Handle vector type conversion; float lists are already converted
+        elif source_type == 'vector':
+            if not (type(value) is list and value and type(value[0]) is float):
+                try:
+                    value = convert_vector_to_float_array(value)
+                except ValueError as e:
+                    _warn_conversion('vector', field_name, e)
+                    # Set to None if conversion fails
+                    value = None
+
+        # Ensure non-string, non-numeric, non-bool, non-list values are
+        # converted to strings; the exact-type check passes virtually
+        # every value in O(1), leaving the isinstance scan for subclasses
+        elif type(value) not in _PASSTHROUGH_TYPES:
+            if isinstance(value, (datetime, date)):
+                # Convert to timestamp if not already marked as date type
+                value = convert_date_to_timestamp(value)
+            elif not isinstance(value, (str, int, float, bool, list, type(None))):
+                value = str(value)
+
+        doc[field_name] = value
+
+    return doc
+
+
+def get_current_timestamp() -> int:
+    """Get current Unix timestamp as int64"""
+    return int(time.time())
+
+
+def convert_vector_to_float_array(value: Any) -> Optional[List[float]]:
+    """
+    Convert PostgreSQL vector (pgvector) to float array for Typesense.
+    
+    Supports:
+    - pgvector.Vector objects
+    - String representations: "[1.0, 2.0, 3.0]"
+    - Lists/tuples of numbers
+    - None values
+    
+    Args:
+        value: The vector value to convert
+    
+    Returns:
+        List of floats, or None if value is None
+    
+    Raises:
+        ValueError: If the value cannot be converted to a float array
+    """
+    if value is None:
+        return None
+    
+    # Already a list
+    if isinstance(value, list):
+        # Embeddings usually arrive as float lists already: an O(1) check
+        # on the first element skips N float() calls for the common case.
+        if not value or type(value[0]) is float:
+            return value
+        try:
+            # One C-level cast over the whole vector beats per-element
+            # float() boxing for 768/1536-dim embeddings.
+            if np is not None:
+                return np.asarray(value, dtype=np.float64).tolist()
+            return [float(x) for x in value]
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid vector list: {value}. Error: {e}")
+
+    # Tuple
+    if isinstance(value, tuple):
+        try:
+            if np is not None:
+                return np.asarray(value, dtype=np.float64).tolist()
+            return [float(x) for x in value]
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid vector tuple: {value}. Error: {e}")
+    
+    
+    # pgvector Vector object
+    if hasattr(value, 'tolist'):
+        # pgvector.Vector has a tolist() method
+        try:
+            result = value.tolist()
+        except Exception as e:
+            raise ValueError(f"Failed to convert pgvector.Vector: {e}")
+        # tolist() already yields Python floats, so re-coercing every
+        # element was pure overhead on 1536-dim embeddings; a single
+        # first-element check covers implementations that return ints.
+        if not result or isinstance(result[0], float):
+            return result
+        return [float(x) for x in result]
+    
+    # String representation
+    if isinstance(value, str):
+        # Try parsing as string representation of list
+        # pgvector returns strings like "[1.0, 2.0, 3.0]"
+        value = value.strip()
+        
+        if value.startswith('[') and value.endswith(']'):
+            # Remove brackets and split by comma
+            inner = value[1:-1].strip()
+            if not inner:
+                return []
+
+            # numpy's sep-mode parser tokenizes the whole string in C —
+            # the Python split + per-token strip/float path is the
+            # bottleneck for 1536-dim embedding strings. fromstring
+            # silently truncates on malformed input, so the element count
+            # is checked against the separators before trusting it.
+            if np is not None:
+                try:
+                    arr = np.fromstring(inner, sep=',', dtype=np.float64)
+                    if arr.size == inner.count(',') + 1:
+                        return arr.tolist()
+                except Exception:
+                    pass
+
+            try:
+                parts = inner.split(',')
+                return [float(x.strip()) for x in parts]
+            except (ValueError, AttributeError) as e:
+                raise ValueError(f"Failed to parse vector string: {value}. Error: {e}")
+        else:
+            raise ValueError(f"Vector string must be in format '[x, y, z]': {value}")
+    
+    # Try converting directly if it has __iter__ (but not dict, set, etc.)
+    if hasattr(value, '__iter__') and not isinstance(value, (str, bytes, dict, set)):
+        try:
+            return [float(x) for x in value]
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Failed to convert iterable to vector: {value}. Error: {e}")
+    
+    raise ValueError(f"Unsupported vector type: {type(value).__name__}. Value: {value}")
+
+
+# Inverted column mappings, keyed by id() with an identity check (same
+# scheme as _SCHEMA_INDEX_CACHE): config mappings are long-lived, so the
+# inversion runs once per mapping instead of once per document.
+_REVERSE_MAPPING_CACHE: dict = {}
+
+
+def _reverse_mapping(column_mapping: dict) -> dict:
+    """Return the PostgreSQL -> Typesense inverse of a column mapping."""
+    key = id(column_mapping)
+    cached = _REVERSE_MAPPING_CACHE.get(key)
+    if cached is None or cached[0] is not column_mapping:
+        if len(_REVERSE_MAPPING_CACHE) > 64:
+            _REVERSE_MAPPING_CACHE.clear()
+        cached = (column_mapping,
+                  {pg_name: ts_name for ts_name, pg_name in column_mapping.items()})
+        _REVERSE_MAPPING_CACHE[key] = cached
+    return cached[1]
+
+
+def apply_column_aliases(doc: dict, column_mapping: dict, *, inplace: bool = False) -> dict:
+    """
+    Apply column aliasing to map PostgreSQL column names to Typesense field names.
+
+    Args:
+        doc: Document with PostgreSQL column names
+        column_mapping: Dict mapping Typesense field names to PostgreSQL column names
+        inplace: Rename keys directly on doc instead of building a new dict;
+            the caller must not retain the pre-aliased view.
+
+    Returns:
+        Document with Typesense field names
+    """
+    if not column_mapping:
+        return doc
+
+    # Reverse the mapping (PostgreSQL -> Typesense), memoized per mapping
+    reverse_mapping = _reverse_mapping(column_mapping)
+
+    # Few renames on a wide document: move just the aliased keys rather
+    # than re-inserting every key. dict.copy is a C-level clone, so
+    # copy+pop wins whenever the mapping is much smaller than the doc.
+    # (Renamed keys land at the end of the dict; key order is not
+    # significant for Typesense documents.)
+    if inplace or len(reverse_mapping) < 3 or len(reverse_mapping) * 4 <= len(doc):
+        aliased_doc = doc if inplace else doc.copy()
+        for pg_col, ts_col in reverse_mapping.items():
+            if pg_col in aliased_doc:
+                aliased_doc[ts_col] = aliased_doc.pop(pg_col)
+        return aliased_doc
+
+    aliased_doc = {}
+    for pg_col, value in doc.items():
+        # Use the aliased name if it exists, otherwise keep original
+        ts_col = reverse_mapping.get(pg_col, pg_col)
+        aliased_doc[ts_col] = value
+
+    return aliased_doc
+
+
+def remove_unmapped_fields(doc: dict, schema: list) -> dict:
+    """
+    Remove fields from document that are not in the schema.
+    
+    Args:
+        doc: Document to filter
+        schema: Schema definition with field names
+    
+    Returns:
+        Filtered document with only schema fields
+    """
+    schema_fields = _schema_index(schema)[2]
+    return {k: v for k, v in doc.items() if k in schema_fields}
+
+
+# View-name sets per connection, keyed by id() with an identity check so a
+# recycled id can never serve another connection's entry (same scheme as
+# _SCHEMA_INDEX_CACHE).
+_VIEW_CACHE: dict = {}
+
+
+def clear_view_cache(conn=None) -> None:
+    """
+    Drop the cached view map for a connection (or all connections).
+
+    Call after creating or dropping views mid-process so is_view re-reads
+    the catalog.
+    """
+    if conn is None:
+        _VIEW_CACHE.clear()
+    else:
+        _VIEW_CACHE.pop(id(conn), None)
+
+
+def is_view(conn, table_name: str) -> bool:
+    """
+    Check if a table name is actually a view.
+
+    The first call on a connection fetches all public view names in one
+    round-trip; later calls are an O(1) membership check instead of one
+    query per table.
+
+    Args:
+        conn: PostgreSQL database connection
+        table_name: Name of the table/view to check
+
+    Returns:
+        True if the table is a view, False if it's a base table
+    """
+    cached = _VIEW_CACHE.get(id(conn))
+    if cached is None or cached[0] is not conn:
+        if len(_VIEW_CACHE) > 64:
+            _VIEW_CACHE.clear()
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT table_name FROM information_schema.tables
+                WHERE table_schema = 'public' AND table_type = 'VIEW'
+            """)
+            cached = (conn, {row[0] for row in cur.fetchall()})
+        _VIEW_CACHE[id(conn)] = cached
+    return table_name in cached[1]
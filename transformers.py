@@ -1,6 +1,38 @@
 # transformers.py
+import re
 import time
-from datetime import datetime
+from functools import lru_cache
+
+from pg_to_typesense.utils import convert_date_to_timestamp
+
+# Timestamp captured once per sync batch: rows missing created_at/
+# registered_at all get the same "now" anyway, so thousands of per-row
+# time.time() calls collapse into one.
+_BATCH_NOW = None
+
+# Comma-with-surrounding-whitespace separator: one C-level regex scan
+# replaces split + a per-token strip() that walks each token twice.
+_SPLIT_RE = re.compile(r'\s*,\s*')
+
+
+def _split_csv(value):
+    """Split a comma-separated string into stripped, non-empty tokens."""
+    return [t for t in _SPLIT_RE.split(value.strip()) if t]
+
+
+def begin_batch(now=None):
+    """Capture the batch timestamp; call at the start of each sync batch.
+
+    Until called (or between calls), transformers fall back to per-row
+    time.time(), so existing callers are unaffected.
+    """
+    global _BATCH_NOW
+    _BATCH_NOW = int(time.time()) if now is None else int(now)
+    return _BATCH_NOW
+
+
+def _now():
+    return _BATCH_NOW if _BATCH_NOW is not None else int(time.time())
 
 
 def transform_tender(doc):
@@ -36,20 +68,10 @@ def transform_product(doc):
         doc['tags'] = []
     elif isinstance(doc['tags'], str):
         # Convert comma-separated string to array
-        doc['tags'] = [tag.strip() for tag in doc['tags'].split(',') if tag.strip()]
+        doc['tags'] = _split_csv(doc['tags'])
     
     # Convert datetime to Unix timestamp (int64)
-    if 'created_at' in doc:
-        if isinstance(doc['created_at'], datetime):
-            doc['created_at'] = int(doc['created_at'].timestamp())
-        elif isinstance(doc['created_at'], str):
-            try:
-                dt = datetime.fromisoformat(doc['created_at'].replace('Z', '+00:00'))
-                doc['created_at'] = int(dt.timestamp())
-            except:
-                doc['created_at'] = int(time.time())
-    else:
-        doc['created_at'] = int(time.time())
+    doc['created_at'] = _to_ts(doc.get('created_at'))
     
     return doc
 
@@ -83,23 +105,133 @@ def transform_user(doc):
         doc['roles'] = ['user']
     elif isinstance(doc['roles'], str):
         # Convert comma-separated string to array
-        doc['roles'] = [role.strip() for role in doc['roles'].split(',') if role.strip()]
+        doc['roles'] = _split_csv(doc['roles'])
     
     # Convert registration timestamp
-    if 'registered_at' in doc:
-        if isinstance(doc['registered_at'], datetime):
-            doc['registered_at'] = int(doc['registered_at'].timestamp())
-        elif isinstance(doc['registered_at'], str):
-            try:
-                dt = datetime.fromisoformat(doc['registered_at'].replace('Z', '+00:00'))
-                doc['registered_at'] = int(dt.timestamp())
-            except:
-                doc['registered_at'] = int(time.time())
-    else:
-        doc['registered_at'] = int(time.time())
+    doc['registered_at'] = _to_ts(doc.get('registered_at'))
     
     # Set default is_verified
     if 'is_verified' not in doc:
         doc['is_verified'] = False
-    
+
     return doc
+
+
+def _to_ts(value):
+    """Coerce created_at/registered_at to a Unix timestamp.
+
+    Delegates to convert_date_to_timestamp — one shared, string-cached
+    parsing path instead of per-transformer isoformat logic — and fills
+    missing or unparseable values with the batch timestamp.
+    """
+    try:
+        ts = convert_date_to_timestamp(value)
+    except ValueError:
+        return _now()
+    return ts if ts is not None else _now()
+
+
+def _spec_products(keys):
+    """Body lines of transform_product specialized to a known column set."""
+    lines = []
+    if 'name' in keys:
+        lines.append("doc['product_name'] = doc.pop('name')")
+    if 'price' in keys:
+        lines.append("doc['is_on_sale'] = doc['price'] < 10.0")
+    else:
+        # doc.get('price', 0) < 10.0 with price absent
+        lines.append("doc['is_on_sale'] = True")
+    if 'category' not in keys:
+        lines.append("doc['category'] = 'Uncategorized'")
+    if 'brand' not in keys:
+        lines.append("doc['brand'] = 'Generic'")
+    if 'stock_quantity' not in keys:
+        lines.append("doc['stock_quantity'] = 0")
+    if 'tags' in keys:
+        lines.append("v = doc['tags']")
+        lines.append("if isinstance(v, str):")
+        lines.append("    doc['tags'] = _split_csv(v)")
+    else:
+        lines.append("doc['tags'] = []")
+    if 'created_at' in keys:
+        lines.append("doc['created_at'] = _to_ts(doc['created_at'])")
+    else:
+        lines.append("doc['created_at'] = _now()")
+    return lines
+
+
+def _spec_users(keys):
+    """Body lines of transform_user specialized to a known column set."""
+    lines = []
+    if 'full_name' not in keys:
+        if 'first_name' in keys and 'last_name' in keys:
+            lines.append("doc['full_name'] = f\"{doc['first_name']} {doc['last_name']}\"")
+        elif 'username' in keys:
+            lines.append("doc['full_name'] = doc['username'].upper()")
+        else:
+            lines.append("doc['full_name'] = 'Unknown User'")
+    if 'account_type' not in keys:
+        lines.append("doc['account_type'] = 'free'")
+    if 'status' not in keys:
+        lines.append("doc['status'] = 'active'")
+    if 'roles' in keys:
+        lines.append("v = doc['roles']")
+        lines.append("if isinstance(v, str):")
+        lines.append("    doc['roles'] = _split_csv(v)")
+    else:
+        lines.append("doc['roles'] = ['user']")
+    if 'registered_at' in keys:
+        lines.append("doc['registered_at'] = _to_ts(doc['registered_at'])")
+    else:
+        lines.append("doc['registered_at'] = _now()")
+    if 'is_verified' not in keys:
+        lines.append("doc['is_verified'] = False")
+    return lines
+
+
+_TRANSFORMER_SPECS = {'products': _spec_products, 'users': _spec_users}
+_GENERIC_TRANSFORMERS = {
+    'tenders': transform_tender,
+    'products': transform_product,
+    'users': transform_user,
+}
+
+
+@lru_cache(maxsize=None)
+def compile_transformer(table_name, doc_keys, fallback=None):
+    """
+    Build a transformer specialized to a table's known column set.
+
+    Postgres rows for a given table always carry the same columns, so the
+    per-row `'x' in doc` ladders in transform_product/transform_user can be
+    decided once here: branches whose outcome follows from doc_keys are
+    compiled into straight-line code or dropped entirely. The sync loop
+    calls this per table with the first fetched row's column set.
+
+    Args:
+        table_name: Table the transformer serves ('products' or 'users')
+        doc_keys: frozenset of column names present in every row, or None
+            when the column set is unknown
+        fallback: The configured transformer to keep when specialization
+            does not apply. A custom fallback (anything other than this
+            module's generic for the table) is always returned unchanged —
+            specialization must never replace a user-supplied transformer.
+
+    Returns:
+        A specialized transformer; the fallback (or this module's generic
+        transformer) when the table has no spec or the column set is
+        unknown; None when the table is unknown and no fallback is given.
+    """
+    generic = _GENERIC_TRANSFORMERS.get(table_name)
+    if fallback is not None and fallback is not generic:
+        return fallback
+    spec = _TRANSFORMER_SPECS.get(table_name)
+    if spec is None or doc_keys is None:
+        return generic if generic is not None else fallback
+    body = spec(frozenset(doc_keys)) + ["return doc"]
+    src = "def _specialized(doc):\n" + "\n".join("    " + line for line in body)
+    namespace = {'time': time, '_to_ts': _to_ts, '_now': _now, '_split_csv': _split_csv}
+    exec(src, namespace)
+    fn = namespace['_specialized']
+    fn.__name__ = f"transform_{table_name}_compiled"
+    return fn